@@ -1,12 +1,35 @@
+import hashlib
 import json
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from html import escape
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _freeze_style(style: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Cópia somente leitura de um estilo (inclusive do dict 'style')."""
+    return MappingProxyType({
+        key: MappingProxyType(dict(value)) if isinstance(value, Mapping) else value
+        for key, value in style.items()
+    })
 
 
 class StyleProvider:
     """Provedor de estilos padrão usando Tailwind CSS."""
     
-    DEFAULT_STYLES = {
+    _styles: Dict[str, Mapping[str, Any]] = {
         'button': {
             'class_name': (
                 'px-4 py-2 bg-blue-600 text-white font-medium rounded-md '
@@ -183,6 +206,15 @@ class StyleProvider:
             'style': {}
         }
     }
+    
+    # DEFAULT_STYLES é somente leitura: mudanças passam por register_style e 
+    # remove_style, que mantêm a versão (e o get_fingerprint) em dia
+    _styles = dict(zip(_styles, map(_freeze_style, _styles.values())))
+    DEFAULT_STYLES: Mapping[str, Mapping[str, Any]] = MappingProxyType(_styles)
+    
+    # Versão dos estilos e (versão, hash) do último get_fingerprint
+    _version = 0
+    _fingerprint: Optional[Tuple[int, str]] = None
 
     @classmethod
     def get_style(cls, component_type: str, variant: str = None) -> Dict[str, Any]:
@@ -222,10 +254,11 @@ class StyleProvider:
         if variant:
             key = f"{component_type}_{variant}"
         
-        cls.DEFAULT_STYLES[key] = {
+        cls._styles[key] = _freeze_style({
             'class_name': class_name,
             'style': style or {}
-        }
+        })
+        cls._version += 1
     
     @classmethod
     def get_all_styles(cls) -> Dict[str, Dict[str, Any]]:
@@ -253,10 +286,34 @@ class StyleProvider:
             key = f"{component_type}_{variant}"
         
         if key in cls.DEFAULT_STYLES:
-            del cls.DEFAULT_STYLES[key]
+            del cls._styles[key]
+            cls._version += 1
             return True
         return False
     
+    @classmethod
+    def get_version(cls) -> int:
+        """Contador incrementado a cada register_style/remove_style."""
+        return cls._version
+    
+    @classmethod
+    def get_fingerprint(cls) -> str:
+        """
+        Retorna um hash estável dos estilos registrados.
+        
+        Muda sempre que um estilo é registrado ou removido, permitindo 
+        invalidar caches que dependem dos estilos. O hash só é recalculado 
+        quando a versão muda (DEFAULT_STYLES não aceita alterações diretas).
+        """
+        version = cls._version
+        if cls._fingerprint is None or cls._fingerprint[0] != version:
+            serialized = json.dumps(
+                cls._styles, sort_keys=True, ensure_ascii=False, default=dict
+            )
+            digest = hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+            cls._fingerprint = (version, digest)
+        return cls._fingerprint[1]
+    
     @classmethod
     def validate_class_name(cls, class_name: str) -> bool:
         """Valida se a class_name contém apenas classes Tailwind válidas."""
@@ -269,14 +326,245 @@ class StyleProvider:
         return not any(char in class_name for char in dangerous_chars)
 
 
+# Regras de omissão dos planos de serialização
+ALWAYS = 'always'            # sempre serializado
+IF_TRUTHY = 'truthy'         # omitido quando falso/vazio
+IF_FALSY = 'falsy'           # serializado apenas quando falso (ex: spell_check)
+IF_NOT_NONE = 'not_none'     # omitido quando None
+IF_NOT_ZERO = 'not_zero'     # omitido quando igual a 0
+
+# Entrada de plano: (nome do atributo, chave de saída, regra de omissão)
+PlanEntry = Tuple[str, str, str]
+
+_RULE_TEMPLATES = {
+    ALWAYS: "    attrs[{key!r}] = self.{attr}",
+    IF_TRUTHY: "    value = self.{attr}\n    if value:\n        attrs[{key!r}] = value",
+    IF_FALSY: "    value = self.{attr}\n    if not value:\n        attrs[{key!r}] = value",
+    IF_NOT_NONE: "    value = self.{attr}\n    if value is not None:\n        attrs[{key!r}] = value",
+    IF_NOT_ZERO: "    value = self.{attr}\n    if value != 0:\n        attrs[{key!r}] = value",
+}
+
+
+def compile_serialization_plan(plan: Tuple[PlanEntry, ...], 
+                               name: str = '_serialize_attributes') -> Callable:
+    """
+    Compila um plano de serialização em uma função especializada.
+    
+    O plano é percorrido uma única vez, gerando o mesmo código que seria 
+    escrito à mão (um `if` por atributo), sem o custo de interpretar a 
+    tabela a cada nó serializado.
+    
+    Args:
+        plan: Sequência de (atributo, chave de saída, regra de omissão)
+        name: Nome da função gerada
+    
+    Returns:
+        Função que recebe o componente e retorna o dicionário de atributos
+    """
+    lines = [f'def {name}(self):', '    attrs = {}']
+    for attr, key, rule in plan:
+        if not attr.isidentifier():
+            raise ValueError(f"Nome de atributo inválido no plano: {attr!r}")
+        if rule not in _RULE_TEMPLATES:
+            raise ValueError(f"Regra de serialização desconhecida: {rule!r}")
+        lines.append(_RULE_TEMPLATES[rule].format(attr=attr, key=key))
+    lines.append('    return attrs')
+    
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace[name]
+
+
+# Encoders JSON disponíveis: todos produzem JSON compacto em UTF-8 (bytes)
+def _encode_stdlib(value: Any) -> bytes:
+    return json.dumps(
+        value, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+JSON_BACKENDS: Dict[str, Callable[[Any], bytes]] = {'json': _encode_stdlib}
+if msgspec is not None:
+    JSON_BACKENDS['msgspec'] = msgspec.json.encode
+if orjson is not None:
+    JSON_BACKENDS['orjson'] = orjson.dumps
+
+# Ordem de preferência quando nenhum backend é escolhido explicitamente
+_JSON_BACKEND_PREFERENCE = ('orjson', 'msgspec', 'json')
+_json_backend_name = next(
+    name for name in _JSON_BACKEND_PREFERENCE if name in JSON_BACKENDS
+)
+_json_encode = JSON_BACKENDS[_json_backend_name]
+
+
+def set_json_backend(name: str) -> None:
+    """
+    Define o encoder usado por to_json_bytes e iter_json.
+    
+    Args:
+        name: 'orjson', 'msgspec' ou 'json' (deve estar instalado)
+    """
+    global _json_backend_name, _json_encode
+    if name not in JSON_BACKENDS:
+        raise ValueError(
+            f"Backend JSON indisponível: {name!r}. "
+            f"Disponíveis: {', '.join(sorted(JSON_BACKENDS))}"
+        )
+    _json_backend_name = name
+    _json_encode = JSON_BACKENDS[name]
+
+
+def get_json_backend() -> str:
+    """Retorna o nome do encoder JSON em uso."""
+    return _json_backend_name
+
+
+def encode_json(value: Any) -> bytes:
+    """Serializa um valor para JSON compacto (bytes) com o backend atual."""
+    return _json_encode(value)
+
+
+class FragmentCache:
+    """
+    Cache LRU de fragmentos (HTML/JSON) de subárvores estáticas.
+    
+    As entradas são indexadas pelo hash do conteúdo da subárvore, então 
+    subárvores idênticas criadas em requisições diferentes compartilham o 
+    mesmo fragmento renderizado.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Tuple[str, str], Any]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_or_render(self, key: str, kind: str, 
+                      render: Callable[[], Any]) -> Any:
+        """
+        Retorna o fragmento em cache ou o renderiza e armazena.
+        
+        Args:
+            key: Hash do conteúdo da subárvore
+            kind: Tipo de fragmento ('html' ou 'json')
+            render: Função que produz o fragmento em caso de miss
+        """
+        cache_key = (key, kind)
+        with self._lock:
+            if cache_key in self._entries:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return self._entries[cache_key]
+            self.misses += 1
+        
+        fragment = render()
+        
+        with self._lock:
+            self._entries[cache_key] = fragment
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return fragment
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Retorna contadores de hit/miss/eviction e o tamanho atual."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+            }
+
+
+# Cache global de fragmentos usado por render_html e iter_json
+fragment_cache = FragmentCache()
+
+# Tamanho padrão (em bytes) das partes geradas por iter_json
+JSON_STREAM_CHUNK_SIZE = 16 * 1024
+
+# Instância compartilhada: StyleProvider não guarda estado por instância
+_DEFAULT_STYLE_PROVIDER = StyleProvider()
+
+
 class BaseComponent(ABC):
     """Classe base para todos os componentes web com injeção de dependência de estilos."""
     
+    # Os componentes usam __slots__ para evitar um __dict__ por instância:
+    # páginas grandes criam milhares de nós com dezenas de atributos cada.
+    # Atributos fora dos slots (via set_attribute) vão para _extra_attributes.
+    __slots__ = (
+        'style_provider', 'style_variant', 'id', 'class_name', 'style',
+        'title', 'lang', 'dir', 'hidden', 'tab_index', 'access_key',
+        'content_editable', 'draggable', 'spell_check', 'translate',
+        'role', 'aria_label', 'aria_describedby', 'aria_labelledby',
+        'data_attributes', 'on_click', 'on_focus', 'on_blur',
+        'on_key_down', 'on_key_up', 'on_key_press', 'static_fragment',
+        '_fragment_key', '_extra_attributes'
+    )
+    
+    # Plano dos atributos globais, na ordem em que são serializados.
+    # Subclasses declaram apenas os seus atributos em `_attribute_plan`.
+    _attribute_plan: Tuple[PlanEntry, ...] = (
+        ('id', 'id', IF_TRUTHY),
+        ('class_name', 'className', IF_TRUTHY),
+        ('style', 'style', IF_TRUTHY),
+        ('title', 'title', IF_TRUTHY),
+        ('lang', 'lang', IF_TRUTHY),
+        ('dir', 'dir', IF_TRUTHY),
+        ('hidden', 'hidden', IF_TRUTHY),
+        ('tab_index', 'tabIndex', IF_NOT_ZERO),
+        ('access_key', 'accessKey', IF_TRUTHY),
+        ('content_editable', 'contentEditable', IF_TRUTHY),
+        ('draggable', 'draggable', IF_TRUTHY),
+        ('spell_check', 'spellCheck', IF_FALSY),
+        ('translate', 'translate', IF_FALSY),
+        ('role', 'role', IF_TRUTHY),
+        ('aria_label', 'ariaLabel', IF_TRUTHY),
+        ('aria_describedby', 'ariaDescribedBy', IF_TRUTHY),
+        ('aria_labelledby', 'ariaLabelledBy', IF_TRUTHY),
+        ('data_attributes', 'dataAttributes', IF_TRUTHY),
+        # Eventos
+        ('on_click', 'onClick', IF_TRUTHY),
+        ('on_focus', 'onFocus', IF_TRUTHY),
+        ('on_blur', 'onBlur', IF_TRUTHY),
+        ('on_key_down', 'onKeyDown', IF_TRUTHY),
+        ('on_key_up', 'onKeyUp', IF_TRUTHY),
+        ('on_key_press', 'onKeyPress', IF_TRUTHY),
+    )
+    
+    def __init_subclass__(cls, **kwargs):
+        """Monta e compila o plano de serialização de cada subclasse."""
+        super().__init_subclass__(**kwargs)
+        own_plan = cls.__dict__.get('_attribute_plan')
+        if own_plan is None:
+            # Sem atributos próprios: reaproveita o plano da classe pai
+            return
+        cls._serialization_plan = cls._serialization_plan + tuple(own_plan)
+        cls._serialize_attributes = compile_serialization_plan(
+            cls._serialization_plan
+        )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         # Injeção de dependência do provedor de estilos
-        self.style_provider = style_provider or StyleProvider()
+        self.style_provider = style_provider or _DEFAULT_STYLE_PROVIDER
         self.style_variant = style_variant
+        self._extra_attributes = None
+        
+        # Subárvore estática: HTML/JSON reaproveitados do fragment_cache.
+        # fragment_key identifica o conteúdo sem serializá-lo (ex: derivado 
+        # da configuração que gera a subárvore); quem o informa garante que 
+        # conteúdos diferentes não compartilham a mesma chave.
+        self.static_fragment = kwargs.get('static_fragment', False)
+        self._fragment_key = kwargs.get('fragment_key')
         
         # Obtém estilos padrão do provedor
         component_type = self.__class__.__name__.lower()
@@ -323,60 +611,7 @@ class BaseComponent(ABC):
     
     def _get_base_attributes(self) -> Dict[str, Any]:
         """Retorna os atributos base comuns a todos os componentes."""
-        attrs = {}
-        
-        if self.id:
-            attrs['id'] = self.id
-        if self.class_name:
-            attrs['className'] = self.class_name
-        if self.style:
-            attrs['style'] = self.style
-        if self.title:
-            attrs['title'] = self.title
-        if self.lang:
-            attrs['lang'] = self.lang
-        if self.dir:
-            attrs['dir'] = self.dir
-        if self.hidden:
-            attrs['hidden'] = self.hidden
-        if self.tab_index != 0:
-            attrs['tabIndex'] = self.tab_index
-        if self.access_key:
-            attrs['accessKey'] = self.access_key
-        if self.content_editable:
-            attrs['contentEditable'] = self.content_editable
-        if self.draggable:
-            attrs['draggable'] = self.draggable
-        if not self.spell_check:
-            attrs['spellCheck'] = self.spell_check
-        if not self.translate:
-            attrs['translate'] = self.translate
-        if self.role:
-            attrs['role'] = self.role
-        if self.aria_label:
-            attrs['ariaLabel'] = self.aria_label
-        if self.aria_describedby:
-            attrs['ariaDescribedBy'] = self.aria_describedby
-        if self.aria_labelledby:
-            attrs['ariaLabelledBy'] = self.aria_labelledby
-        if self.data_attributes:
-            attrs['dataAttributes'] = self.data_attributes
-        
-        # Eventos
-        if self.on_click:
-            attrs['onClick'] = self.on_click
-        if self.on_focus:
-            attrs['onFocus'] = self.on_focus
-        if self.on_blur:
-            attrs['onBlur'] = self.on_blur
-        if self.on_key_down:
-            attrs['onKeyDown'] = self.on_key_down
-        if self.on_key_up:
-            attrs['onKeyUp'] = self.on_key_up
-        if self.on_key_press:
-            attrs['onKeyPress'] = self.on_key_press
-        
-        return attrs
+        return BaseComponent._serialize_attributes(self)
     
     @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
@@ -391,6 +626,62 @@ class BaseComponent(ABC):
             indent=indent
         )
     
+    def to_json_bytes(self) -> bytes:
+        """
+        Converte o componente para JSON compacto em bytes.
+        
+        Usa o backend configurado (orjson/msgspec quando instalados), 
+        pronto para ser enviado sem nova codificação.
+        """
+        return encode_json(self.to_dict())
+    
+    def _stream_dict(self) -> Optional[Dict[str, Any]]:
+        """
+        Dicionário raso usado pelo encoder incremental.
+        
+        Componentes com filhos retornam o mesmo dicionário de to_dict, mas 
+        com os filhos ainda como componentes, para que sejam serializados 
+        sob demanda. Componentes folha retornam None e são serializados 
+        de uma vez via to_dict.
+        """
+        return None
+    
+    def get_fragment_key(self) -> str:
+        """
+        Chave da subárvore no fragment_cache.
+        
+        Usa o fragment_key do construtor quando informado; senão, o hash do 
+        conteúdo atual, recalculado a cada uso para que alterações feitas 
+        depois de uma renderização (ex: InputLabel.set_input_value) gerem 
+        uma nova chave.
+        """
+        if self._fragment_key is not None:
+            return f'{type(self).__name__}:{self._fragment_key}'
+        digest = hashlib.sha1(encode_json(self.to_dict())).hexdigest()
+        return f'{type(self).__name__}:{digest}'
+    
+    @abstractmethod
+    def render_html(self) -> str:
+        """
+        Renderiza o componente como HTML escapado no servidor.
+        
+        Produz o mesmo resultado que o ComponentRenderer (jQuery) gera no 
+        navegador a partir de to_dict().
+        """
+        pass
+    
+    def iter_json(self, chunk_size: int = JSON_STREAM_CHUNK_SIZE):
+        """
+        Serializa o componente para JSON compacto em partes.
+        
+        Args:
+            chunk_size: Tamanho aproximado (em bytes) de cada parte
+        
+        Yields:
+            Partes do JSON; concatenadas equivalem a to_dict() serializado
+        """
+        return iter_json(self, chunk_size)
+    
     def add_class(self, class_name: str) -> 'BaseComponent':
         """Adiciona uma classe CSS ao componente."""
         if class_name and class_name not in self.class_name:
@@ -415,9 +706,25 @@ class BaseComponent(ABC):
             del self.style[property_name]
         return self
     
+    def __getattr__(self, attr_name: str) -> Any:
+        # Chamado apenas quando o atributo não existe nos slots
+        if attr_name != '_extra_attributes':
+            extra_attributes = self._extra_attributes
+            if extra_attributes and attr_name in extra_attributes:
+                return extra_attributes[attr_name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{attr_name}'"
+        )
+    
     def set_attribute(self, attr_name: str, value: Any) -> 'BaseComponent':
         """Define um atributo HTML no componente."""
-        setattr(self, attr_name, value)
+        try:
+            setattr(self, attr_name, value)
+        except AttributeError:
+            # Atributo sem slot correspondente
+            if self._extra_attributes is None:
+                self._extra_attributes = {}
+            self._extra_attributes[attr_name] = value
         return self
     
     def get_attribute(self, attr_name: str, default: Any = None) -> Any:
@@ -432,9 +739,292 @@ class BaseComponent(ABC):
         return True
 
 
+BaseComponent._serialization_plan = BaseComponent._attribute_plan
+BaseComponent._serialize_attributes = compile_serialization_plan(
+    BaseComponent._serialization_plan
+)
+
+
+def _contains_component(value: Any) -> bool:
+    """Verifica se uma estrutura contém componentes ainda não serializados."""
+    if isinstance(value, BaseComponent):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_component(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_contains_component(item) for item in value)
+    return False
+
+
+def _iter_json_parts(value: Any):
+    if isinstance(value, BaseComponent):
+        if value.static_fragment:
+            if value._fragment_key is None:
+                # A chave por conteúdo custaria o mesmo que o próprio fragmento
+                yield encode_json(value.to_dict())
+            else:
+                yield fragment_cache.get_or_render(
+                    value.get_fragment_key(), 'json',
+                    lambda: encode_json(value.to_dict())
+                )
+            return
+        stream_dict = value._stream_dict()
+        if stream_dict is None:
+            yield encode_json(value.to_dict())
+            return
+        value = stream_dict
+    
+    if isinstance(value, dict) and _contains_component(value):
+        separator = b'{'
+        for key, item in value.items():
+            yield separator + encode_json(key) + b':'
+            yield from _iter_json_parts(item)
+            separator = b','
+        yield b'}' if separator == b',' else b'{}'
+    elif isinstance(value, list) and _contains_component(value):
+        separator = b'['
+        for item in value:
+            yield separator
+            yield from _iter_json_parts(item)
+            separator = b','
+        yield b']'
+    else:
+        yield encode_json(value)
+
+
+def iter_json(component: Any, chunk_size: int = JSON_STREAM_CHUNK_SIZE):
+    """
+    Encoder incremental para árvores de componentes (Page, Div, Form...).
+    
+    Percorre a árvore e produz o JSON compacto em partes de aproximadamente 
+    `chunk_size` bytes, sem montar o dicionário completo da página. 
+    O resultado concatenado é idêntico a encode_json(component.to_dict()).
+    
+    Args:
+        component: Componente raiz (ou dict/list contendo componentes)
+        chunk_size: Tamanho aproximado de cada parte
+    
+    Yields:
+        Partes do JSON como bytes (UTF-8)
+    """
+    buffer = []
+    buffered = 0
+    for part in _iter_json_parts(component):
+        buffer.append(part)
+        buffered += len(part)
+        if buffered >= chunk_size:
+            yield b''.join(buffer)
+            buffer = []
+            buffered = 0
+    if buffer:
+        yield b''.join(buffer)
+
+
+# --- Renderização HTML no servidor ---
+# Espelha o ComponentRenderer (static/component_render.js): para o mesmo JSON,
+# render_html produz o mesmo DOM que o renderizador jQuery monta no cliente.
+# Todo conteúdo de texto e valor de atributo é escapado.
+
+# Atributos que o jQuery trata como booleanos (presença = verdadeiro)
+_BOOLEAN_HTML_ATTRIBUTES = frozenset({
+    'autofocus', 'checked', 'disabled', 'hidden', 'ismap', 'multiple',
+    'readonly', 'required', 'selected',
+})
+
+# Eventos vinculados pelo ComponentRenderer.bindEvents
+_HTML_EVENT_ATTRIBUTES = (
+    'onClick', 'onFocus', 'onBlur', 'onKeyDown', 'onKeyUp', 'onKeyPress',
+    'onChange', 'onInput', 'onSubmit', 'onReset', 'onScroll',
+)
+
+# Equivalente a ComponentRenderer.getLayoutClass
+PAGE_LAYOUT_CLASSES = {
+    'grid': 'grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6',
+    'flex': 'flex flex-wrap gap-6',
+    'single': 'space-y-6',
+}
+_DEFAULT_PAGE_LAYOUT_CLASS = PAGE_LAYOUT_CLASSES['grid']
+
+HtmlAttributes = List[Tuple[str, Any]]
+
+
+def _format_html_attributes(pairs: HtmlAttributes) -> str:
+    parts = []
+    for name, value in pairs:
+        if value is True and name in _BOOLEAN_HTML_ATTRIBUTES:
+            parts.append(f' {name}')
+            continue
+        if isinstance(value, bool):
+            value = 'true' if value else 'false'
+        parts.append(f' {name}="{escape(str(value))}"')
+    return ''.join(parts)
+
+
+def _normalize_class_name(class_name: str) -> str:
+    # jQuery.addClass descarta espaços extras e classes repetidas
+    return ' '.join(dict.fromkeys(class_name.split()))
+
+
+def _base_html_attributes(attrs: Dict[str, Any]) -> HtmlAttributes:
+    """Equivalente a ComponentRenderer.applyBaseAttributes."""
+    pairs = []
+    if attrs.get('id'):
+        pairs.append(('id', attrs['id']))
+    if attrs.get('className'):
+        class_name = _normalize_class_name(attrs['className'])
+        if class_name:
+            pairs.append(('class', class_name))
+    if attrs.get('title'):
+        pairs.append(('title', attrs['title']))
+    if attrs.get('lang'):
+        pairs.append(('lang', attrs['lang']))
+    if attrs.get('dir'):
+        pairs.append(('dir', attrs['dir']))
+    if attrs.get('hidden'):
+        pairs.append(('hidden', True))
+    if 'tabIndex' in attrs:
+        pairs.append(('tabindex', attrs['tabIndex']))
+    if attrs.get('accessKey'):
+        pairs.append(('accesskey', attrs['accessKey']))
+    if attrs.get('contentEditable'):
+        pairs.append(('contenteditable', attrs['contentEditable']))
+    if attrs.get('draggable'):
+        pairs.append(('draggable', attrs['draggable']))
+    if 'spellCheck' in attrs:
+        pairs.append(('spellcheck', bool(attrs['spellCheck'])))
+    if 'translate' in attrs:
+        pairs.append(('translate', 'yes' if attrs['translate'] else 'no'))
+    if attrs.get('role'):
+        pairs.append(('role', attrs['role']))
+    if attrs.get('ariaLabel'):
+        pairs.append(('aria-label', attrs['ariaLabel']))
+    if attrs.get('ariaDescribedBy'):
+        pairs.append(('aria-describedby', attrs['ariaDescribedBy']))
+    if attrs.get('ariaLabelledBy'):
+        pairs.append(('aria-labelledby', attrs['ariaLabelledBy']))
+    
+    style = attrs.get('style')
+    if style and isinstance(style, dict):
+        pairs.append(('style', '; '.join(
+            f'{name}: {value}' for name, value in style.items()
+        )))
+    
+    for key, value in (attrs.get('dataAttributes') or {}).items():
+        pairs.append((f'data-{key}', value))
+    
+    # Eventos como handlers inline (o ComponentRenderer usa new Function)
+    for event_attr in _HTML_EVENT_ATTRIBUTES:
+        if attrs.get(event_attr):
+            pairs.append((event_attr.lower(), attrs[event_attr]))
+    
+    return pairs
+
+
+def render_html_element(tag: str, pairs: HtmlAttributes, 
+                        attrs: Dict[str, Any], inner: str = '', 
+                        void: bool = False) -> str:
+    """
+    Monta a tag HTML com os atributos específicos seguidos dos base.
+    
+    Args:
+        tag: Nome da tag
+        pairs: Atributos específicos do componente (nome, valor)
+        attrs: Atributos serializados (to_dict) para os atributos base
+        inner: HTML interno já escapado
+        void: Se a tag não tem fechamento (input, img)
+    """
+    opening = f'<{tag}{_format_html_attributes(pairs + _base_html_attributes(attrs))}>'
+    if void:
+        return opening
+    return f'{opening}{inner}</{tag}>'
+
+
+def _escape_content(content: Any) -> str:
+    if content is None or content == '':
+        return ''
+    return escape(str(content))
+
+
+def _render_child(child: 'BaseComponent') -> str:
+    if child.static_fragment:
+        return fragment_cache.get_or_render(
+            child.get_fragment_key(), 'html', child.render_html
+        )
+    return child.render_html()
+
+
+def _render_children(components: List['BaseComponent']) -> str:
+    return ''.join(_render_child(child) for child in components)
+
+
+def _render_checkable(component: 'BaseComponent', input_type: str, 
+                      wrapper_class: str) -> str:
+    """Renderiza Checkbox/Radio: input envolvido por um div com label."""
+    attrs = component._serialize_attributes()
+    pairs = [('type', input_type)]
+    
+    for key in ('name', 'value'):
+        if attrs.get(key):
+            pairs.append((key, attrs[key]))
+    for key in ('checked', 'disabled', 'required', 'autofocus'):
+        if attrs.get(key):
+            pairs.append((key, True))
+    
+    inner = render_html_element('input', pairs, attrs, void=True)
+    if component.label:
+        label_pairs = [('for', attrs['id'])] if attrs.get('id') else []
+        inner += (
+            f'<label{_format_html_attributes(label_pairs)}>'
+            f'{_escape_content(component.label)}</label>'
+        )
+    
+    return f'<div class="{wrapper_class}">{inner}</div>'
+
+
 class Input(BaseComponent):
     """Componente Input com estilos padrão."""
     
+    __slots__ = (
+        'type', 'value', 'placeholder', 'name', 'disabled', 'readonly',
+        'required', 'autofocus', 'autocomplete', 'max_length',
+        'min_length', 'max', 'min', 'step', 'pattern', 'size',
+        'multiple', 'accept', 'capture', 'form', 'form_action',
+        'form_enctype', 'form_method', 'form_novalidate', 'form_target',
+        'list', 'checked', 'on_change', 'on_input'
+    )
+    
+    _attribute_plan = (
+        ('type', 'type', ALWAYS),
+        ('value', 'value', ALWAYS),
+        ('placeholder', 'placeholder', ALWAYS),
+        ('name', 'name', ALWAYS),
+        ('disabled', 'disabled', ALWAYS),
+        ('readonly', 'readonly', ALWAYS),
+        ('required', 'required', ALWAYS),
+        ('autofocus', 'autofocus', ALWAYS),
+        ('autocomplete', 'autocomplete', ALWAYS),
+        ('size', 'size', ALWAYS),
+        ('multiple', 'multiple', ALWAYS),
+        ('checked', 'checked', ALWAYS),
+        ('max_length', 'maxLength', IF_NOT_NONE),
+        ('min_length', 'minLength', IF_NOT_NONE),
+        ('max', 'max', IF_TRUTHY),
+        ('min', 'min', IF_TRUTHY),
+        ('step', 'step', IF_TRUTHY),
+        ('pattern', 'pattern', IF_TRUTHY),
+        ('accept', 'accept', IF_TRUTHY),
+        ('capture', 'capture', IF_TRUTHY),
+        ('form', 'form', IF_TRUTHY),
+        ('form_action', 'formAction', IF_TRUTHY),
+        ('form_enctype', 'formEncType', IF_TRUTHY),
+        ('form_method', 'formMethod', IF_TRUTHY),
+        ('form_novalidate', 'formNoValidate', IF_TRUTHY),
+        ('form_target', 'formTarget', IF_TRUTHY),
+        ('list', 'list', IF_TRUTHY),
+        ('on_change', 'onChange', IF_TRUTHY),
+        ('on_input', 'onInput', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -473,67 +1063,66 @@ class Input(BaseComponent):
         self.on_input = kwargs.get('on_input', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        attrs.update({
-            'type': self.type,
-            'value': self.value,
-            'placeholder': self.placeholder,
-            'name': self.name,
-            'disabled': self.disabled,
-            'readonly': self.readonly,
-            'required': self.required,
-            'autofocus': self.autofocus,
-            'autocomplete': self.autocomplete,
-            'size': self.size,
-            'multiple': self.multiple,
-            'checked': self.checked
-        })
-        
-        if self.max_length is not None:
-            attrs['maxLength'] = self.max_length
-        if self.min_length is not None:
-            attrs['minLength'] = self.min_length
-        if self.max:
-            attrs['max'] = self.max
-        if self.min:
-            attrs['min'] = self.min
-        if self.step:
-            attrs['step'] = self.step
-        if self.pattern:
-            attrs['pattern'] = self.pattern
-        if self.accept:
-            attrs['accept'] = self.accept
-        if self.capture:
-            attrs['capture'] = self.capture
-        if self.form:
-            attrs['form'] = self.form
-        if self.form_action:
-            attrs['formAction'] = self.form_action
-        if self.form_enctype:
-            attrs['formEncType'] = self.form_enctype
-        if self.form_method:
-            attrs['formMethod'] = self.form_method
-        if self.form_novalidate:
-            attrs['formNoValidate'] = self.form_novalidate
-        if self.form_target:
-            attrs['formTarget'] = self.form_target
-        if self.list:
-            attrs['list'] = self.list
-        if self.on_change:
-            attrs['onChange'] = self.on_change
-        if self.on_input:
-            attrs['onInput'] = self.on_input
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'input',
             'attributes': attrs
         }
+    
+    def render_html(self) -> str:
+        attrs = self._serialize_attributes()
+        pairs = []
+        
+        if attrs.get('type'):
+            pairs.append(('type', attrs['type']))
+        if attrs.get('value') not in (None, ''):
+            pairs.append(('value', attrs['value']))
+        for key in ('placeholder', 'name'):
+            if attrs.get(key):
+                pairs.append((key, attrs[key]))
+        for key in ('disabled', 'readonly', 'required', 'autofocus'):
+            if attrs.get(key):
+                pairs.append((key, True))
+        if attrs.get('autocomplete'):
+            pairs.append(('autocomplete', attrs['autocomplete']))
+        if 'maxLength' in attrs:
+            pairs.append(('maxlength', attrs['maxLength']))
+        if 'minLength' in attrs:
+            pairs.append(('minlength', attrs['minLength']))
+        for key in ('max', 'min', 'step', 'pattern', 'size'):
+            if attrs.get(key):
+                pairs.append((key, attrs[key]))
+        if attrs.get('multiple'):
+            pairs.append(('multiple', True))
+        for key in ('accept', 'capture', 'list'):
+            if attrs.get(key):
+                pairs.append((key, attrs[key]))
+        if attrs.get('checked'):
+            pairs.append(('checked', True))
+        
+        return render_html_element('input', pairs, attrs, void=True)
 
 
 class Select(BaseComponent):
     """Componente Select com estilos padrão."""
     
+    __slots__ = (
+        'name', 'disabled', 'required', 'autofocus', 'multiple', 'size',
+        'form', 'on_change', 'options'
+    )
+    
+    _attribute_plan = (
+        ('name', 'name', ALWAYS),
+        ('disabled', 'disabled', ALWAYS),
+        ('required', 'required', ALWAYS),
+        ('autofocus', 'autofocus', ALWAYS),
+        ('multiple', 'multiple', ALWAYS),
+        ('size', 'size', ALWAYS),
+        ('form', 'form', IF_TRUTHY),
+        ('on_change', 'onChange', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -565,32 +1154,35 @@ class Select(BaseComponent):
         return self
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        attrs.update({
-            'name': self.name,
-            'disabled': self.disabled,
-            'required': self.required,
-            'autofocus': self.autofocus,
-            'multiple': self.multiple,
-            'size': self.size
-        })
-        
-        if self.form:
-            attrs['form'] = self.form
-        if self.on_change:
-            attrs['onChange'] = self.on_change
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'select',
             'attributes': attrs,
             'options': [option.to_dict() for option in self.options]
         }
+    
+    def render_html(self) -> str:
+        attrs = self._serialize_attributes()
+        pairs = []
+        
+        if attrs.get('name'):
+            pairs.append(('name', attrs['name']))
+        for key in ('disabled', 'required', 'autofocus', 'multiple'):
+            if attrs.get(key):
+                pairs.append((key, True))
+        if attrs.get('size'):
+            pairs.append(('size', attrs['size']))
+        
+        options = ''.join(option.render_html() for option in self.options)
+        return render_html_element('select', pairs, attrs, options)
 
 
 class Option:
     """Componente Option para Select."""
     
+    __slots__ = ('value', 'text', 'selected', 'disabled')
+    
     def __init__(self, value: str = '', text: str = '', 
                  selected: bool = False, disabled: bool = False):
         self.value = value
@@ -608,11 +1200,47 @@ class Option:
             },
             'content': self.text
         }
+    
+    def render_html(self) -> str:
+        pairs = []
+        if self.value is not None:
+            pairs.append(('value', self.value))
+        if self.selected:
+            pairs.append(('selected', True))
+        if self.disabled:
+            pairs.append(('disabled', True))
+        return f'<option{_format_html_attributes(pairs)}>{_escape_content(self.text)}</option>'
 
 
 class Textarea(BaseComponent):
     """Componente Textarea com estilos padrão."""
     
+    __slots__ = (
+        'name', 'disabled', 'readonly', 'required', 'autofocus',
+        'placeholder', 'rows', 'cols', 'max_length', 'min_length',
+        'wrap', 'autocomplete', 'form', 'content', 'on_change',
+        'on_input', 'on_scroll'
+    )
+    
+    _attribute_plan = (
+        ('name', 'name', ALWAYS),
+        ('disabled', 'disabled', ALWAYS),
+        ('readonly', 'readonly', ALWAYS),
+        ('required', 'required', ALWAYS),
+        ('autofocus', 'autofocus', ALWAYS),
+        ('placeholder', 'placeholder', ALWAYS),
+        ('rows', 'rows', ALWAYS),
+        ('cols', 'cols', ALWAYS),
+        ('wrap', 'wrap', ALWAYS),
+        ('autocomplete', 'autocomplete', ALWAYS),
+        ('max_length', 'maxLength', IF_NOT_NONE),
+        ('min_length', 'minLength', IF_NOT_NONE),
+        ('form', 'form', IF_TRUTHY),
+        ('on_change', 'onChange', IF_TRUTHY),
+        ('on_input', 'onInput', IF_TRUTHY),
+        ('on_scroll', 'onScroll', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -638,44 +1266,62 @@ class Textarea(BaseComponent):
         self.on_scroll = kwargs.get('on_scroll', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        attrs.update({
-            'name': self.name,
-            'disabled': self.disabled,
-            'readonly': self.readonly,
-            'required': self.required,
-            'autofocus': self.autofocus,
-            'placeholder': self.placeholder,
-            'rows': self.rows,
-            'cols': self.cols,
-            'wrap': self.wrap,
-            'autocomplete': self.autocomplete
-        })
-        
-        if self.max_length is not None:
-            attrs['maxLength'] = self.max_length
-        if self.min_length is not None:
-            attrs['minLength'] = self.min_length
-        if self.form:
-            attrs['form'] = self.form
-        if self.on_change:
-            attrs['onChange'] = self.on_change
-        if self.on_input:
-            attrs['onInput'] = self.on_input
-        if self.on_scroll:
-            attrs['onScroll'] = self.on_scroll
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'textarea',
             'attributes': attrs,
             'content': self.content
         }
+    
+    def render_html(self) -> str:
+        attrs = self._serialize_attributes()
+        pairs = []
+        
+        if attrs.get('name'):
+            pairs.append(('name', attrs['name']))
+        for key in ('disabled', 'readonly', 'required', 'autofocus'):
+            if attrs.get(key):
+                pairs.append((key, True))
+        for key in ('placeholder', 'rows', 'cols'):
+            if attrs.get(key):
+                pairs.append((key, attrs[key]))
+        if 'maxLength' in attrs:
+            pairs.append(('maxlength', attrs['maxLength']))
+        if 'minLength' in attrs:
+            pairs.append(('minlength', attrs['minLength']))
+        for key in ('wrap', 'autocomplete'):
+            if attrs.get(key):
+                pairs.append((key, attrs[key]))
+        
+        return render_html_element(
+            'textarea', pairs, attrs, _escape_content(self.content)
+        )
 
 
 class Button(BaseComponent):
     """Componente Button com estilos padrão."""
     
+    __slots__ = (
+        'type', 'name', 'value', 'disabled', 'autofocus', 'form',
+        'form_action', 'form_enctype', 'form_method', 'form_novalidate',
+        'form_target', 'content'
+    )
+    
+    _attribute_plan = (
+        ('type', 'type', ALWAYS),
+        ('name', 'name', ALWAYS),
+        ('value', 'value', ALWAYS),
+        ('disabled', 'disabled', ALWAYS),
+        ('autofocus', 'autofocus', ALWAYS),
+        ('form', 'form', IF_TRUTHY),
+        ('form_action', 'formAction', IF_TRUTHY),
+        ('form_enctype', 'formEncType', IF_TRUTHY),
+        ('form_method', 'formMethod', IF_TRUTHY),
+        ('form_novalidate', 'formNoValidate', IF_TRUTHY),
+        ('form_target', 'formTarget', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -694,39 +1340,44 @@ class Button(BaseComponent):
         self.content = kwargs.get('content', 'Button')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        attrs.update({
-            'type': self.type,
-            'name': self.name,
-            'value': self.value,
-            'disabled': self.disabled,
-            'autofocus': self.autofocus
-        })
-        
-        if self.form:
-            attrs['form'] = self.form
-        if self.form_action:
-            attrs['formAction'] = self.form_action
-        if self.form_enctype:
-            attrs['formEncType'] = self.form_enctype
-        if self.form_method:
-            attrs['formMethod'] = self.form_method
-        if self.form_novalidate:
-            attrs['formNoValidate'] = self.form_novalidate
-        if self.form_target:
-            attrs['formTarget'] = self.form_target
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'button',
             'attributes': attrs,
             'content': self.content
         }
+    
+    def render_html(self) -> str:
+        attrs = self._serialize_attributes()
+        pairs = []
+        
+        for key in ('type', 'name', 'value'):
+            if attrs.get(key):
+                pairs.append((key, attrs[key]))
+        for key in ('disabled', 'autofocus'):
+            if attrs.get(key):
+                pairs.append((key, True))
+        for key in ('formAction', 'formEncType', 'formMethod', 
+                    'formNoValidate', 'formTarget'):
+            if attrs.get(key):
+                pairs.append((key.lower(), attrs[key]))
+        
+        return render_html_element(
+            'button', pairs, attrs, _escape_content(self.content or 'Button')
+        )
 
 
 class Label(BaseComponent):
     """Componente Label com estilos padrão."""
     
+    __slots__ = ('html_for', 'form', 'content')
+    
+    _attribute_plan = (
+        ('html_for', 'htmlFor', IF_TRUTHY),
+        ('form', 'form', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -736,23 +1387,31 @@ class Label(BaseComponent):
         self.content = kwargs.get('content', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        if self.html_for:
-            attrs['htmlFor'] = self.html_for
-        if self.form:
-            attrs['form'] = self.form
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'label',
             'attributes': attrs,
             'content': self.content
         }
+    
+    def render_html(self) -> str:
+        attrs = self._serialize_attributes()
+        pairs = []
+        
+        if attrs.get('htmlFor'):
+            pairs.append(('for', attrs['htmlFor']))
+        
+        return render_html_element(
+            'label', pairs, attrs, _escape_content(self.content)
+        )
 
 
 class Div(BaseComponent):
     """Componente Div com estilos padrão."""
     
+    __slots__ = ('content', 'components')
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -766,7 +1425,7 @@ class Div(BaseComponent):
         return self
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
+        attrs = self._serialize_attributes()
         
         result = {
             'type': 'div',
@@ -780,11 +1439,31 @@ class Div(BaseComponent):
             result['content'] = self.content
         
         return result
+    
+    def _stream_dict(self) -> Dict[str, Any]:
+        result = {
+            'type': 'div',
+            'attributes': self._serialize_attributes()
+        }
+        
+        if self.components:
+            result['components'] = self.components
+        
+        if self.content:
+            result['content'] = self.content
+        
+        return result
+    
+    def render_html(self) -> str:
+        inner = _escape_content(self.content) + _render_children(self.components)
+        return render_html_element('div', [], self._serialize_attributes(), inner)
 
 
 class Span(BaseComponent):
     """Componente Span com estilos padrão."""
     
+    __slots__ = ('content',)
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -792,18 +1471,42 @@ class Span(BaseComponent):
         self.content = kwargs.get('content', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'span',
             'attributes': attrs,
             'content': self.content
         }
+    
+    def render_html(self) -> str:
+        return render_html_element(
+            'span', [], self._serialize_attributes(), 
+            _escape_content(self.content)
+        )
 
 
 class Form(BaseComponent):
     """Componente Form com estilos padrão."""
     
+    __slots__ = (
+        'action', 'method', 'enctype', 'target', 'accept_charset',
+        'autocomplete', 'novalidate', 'components', 'on_submit',
+        'on_reset'
+    )
+    
+    _attribute_plan = (
+        ('action', 'action', ALWAYS),
+        ('method', 'method', ALWAYS),
+        ('enctype', 'encType', ALWAYS),
+        ('target', 'target', ALWAYS),
+        ('accept_charset', 'acceptCharset', ALWAYS),
+        ('autocomplete', 'autocomplete', ALWAYS),
+        ('novalidate', 'noValidate', ALWAYS),
+        ('on_submit', 'onSubmit', IF_TRUTHY),
+        ('on_reset', 'onReset', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -827,33 +1530,57 @@ class Form(BaseComponent):
         return self
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        attrs.update({
-            'action': self.action,
-            'method': self.method,
-            'encType': self.enctype,
-            'target': self.target,
-            'acceptCharset': self.accept_charset,
-            'autocomplete': self.autocomplete,
-            'noValidate': self.novalidate
-        })
-        
-        if self.on_submit:
-            attrs['onSubmit'] = self.on_submit
-        if self.on_reset:
-            attrs['onReset'] = self.on_reset
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'form',
             'attributes': attrs,
             'components': [child.to_dict() for child in self.components]
         }
+    
+    def _stream_dict(self) -> Dict[str, Any]:
+        return {
+            'type': 'form',
+            'attributes': self._serialize_attributes(),
+            'components': self.components
+        }
+    
+    def render_html(self) -> str:
+        attrs = self._serialize_attributes()
+        pairs = []
+        
+        for key, html_name in (('action', 'action'), ('method', 'method'), 
+                               ('encType', 'enctype'), ('target', 'target'),
+                               ('acceptCharset', 'accept-charset'), 
+                               ('autocomplete', 'autocomplete'),
+                               ('noValidate', 'novalidate')):
+            if attrs.get(key):
+                pairs.append((html_name, attrs[key]))
+        
+        return render_html_element(
+            'form', pairs, attrs, _render_children(self.components)
+        )
 
 
 class Checkbox(BaseComponent):
     """Componente Checkbox com estilos padrão."""
     
+    __slots__ = (
+        'name', 'value', 'checked', 'disabled', 'required', 'autofocus',
+        'form', 'label', 'on_change'
+    )
+    
+    _attribute_plan = (
+        ('name', 'name', ALWAYS),
+        ('value', 'value', ALWAYS),
+        ('checked', 'checked', ALWAYS),
+        ('disabled', 'disabled', ALWAYS),
+        ('required', 'required', ALWAYS),
+        ('autofocus', 'autofocus', ALWAYS),
+        ('form', 'form', IF_TRUTHY),
+        ('on_change', 'onChange', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -871,32 +1598,39 @@ class Checkbox(BaseComponent):
         self.on_change = kwargs.get('on_change', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        attrs.update({
-            'name': self.name,
-            'value': self.value,
-            'checked': self.checked,
-            'disabled': self.disabled,
-            'required': self.required,
-            'autofocus': self.autofocus
-        })
-        
-        if self.form:
-            attrs['form'] = self.form
-        if self.on_change:
-            attrs['onChange'] = self.on_change
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'checkbox',
             'attributes': attrs,
             'label': self.label
         }
+    
+    def render_html(self) -> str:
+        return _render_checkable(
+            self, 'checkbox', 'checkbox-wrapper flex items-center space-x-2'
+        )
 
 
 class Radio(BaseComponent):
     """Componente Radio com estilos padrão."""
     
+    __slots__ = (
+        'name', 'value', 'checked', 'disabled', 'required', 'autofocus',
+        'form', 'label', 'on_change'
+    )
+    
+    _attribute_plan = (
+        ('name', 'name', ALWAYS),
+        ('value', 'value', ALWAYS),
+        ('checked', 'checked', ALWAYS),
+        ('disabled', 'disabled', ALWAYS),
+        ('required', 'required', ALWAYS),
+        ('autofocus', 'autofocus', ALWAYS),
+        ('form', 'form', IF_TRUTHY),
+        ('on_change', 'onChange', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -914,32 +1648,28 @@ class Radio(BaseComponent):
         self.on_change = kwargs.get('on_change', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        attrs.update({
-            'name': self.name,
-            'value': self.value,
-            'checked': self.checked,
-            'disabled': self.disabled,
-            'required': self.required,
-            'autofocus': self.autofocus
-        })
-        
-        if self.form:
-            attrs['form'] = self.form
-        if self.on_change:
-            attrs['onChange'] = self.on_change
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'radio',
             'attributes': attrs,
             'label': self.label
         }
+    
+    def render_html(self) -> str:
+        return _render_checkable(self, 'radio', 'radio-wrapper')
 
 
 class Fieldset(BaseComponent):
     """Componente Fieldset para agrupar elementos de formulário."""
     
+    __slots__ = ('legend', 'disabled', 'form', 'components')
+    
+    _attribute_plan = (
+        ('disabled', 'disabled', IF_TRUTHY),
+        ('form', 'form', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -955,12 +1685,7 @@ class Fieldset(BaseComponent):
         return self
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        if self.disabled:
-            attrs['disabled'] = self.disabled
-        if self.form:
-            attrs['form'] = self.form
+        attrs = self._serialize_attributes()
         
         result = {
             'type': 'fieldset',
@@ -970,11 +1695,37 @@ class Fieldset(BaseComponent):
         }
         
         return result
+    
+    def _stream_dict(self) -> Dict[str, Any]:
+        return {
+            'type': 'fieldset',
+            'attributes': self._serialize_attributes(),
+            'legend': self.legend,
+            'components': self.components
+        }
+    
+    def render_html(self) -> str:
+        attrs = self._serialize_attributes()
+        pairs = []
+        
+        if attrs.get('disabled'):
+            pairs.append(('disabled', True))
+        if attrs.get('form'):
+            pairs.append(('form', attrs['form']))
+        
+        inner = ''
+        if self.legend:
+            inner = f'<legend>{_escape_content(self.legend)}</legend>'
+        inner += _render_children(self.components)
+        
+        return render_html_element('fieldset', pairs, attrs, inner)
 
 
 class Legend(BaseComponent):
     """Componente Legend para Fieldset."""
     
+    __slots__ = ('content',)
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -982,18 +1733,45 @@ class Legend(BaseComponent):
         self.content = kwargs.get('content', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'legend',
             'attributes': attrs,
             'content': self.content
         }
+    
+    def render_html(self) -> str:
+        return render_html_element(
+            'legend', [], self._serialize_attributes(), 
+            _escape_content(self.content)
+        )
 
 
 class Image(BaseComponent):
     """Componente Image com estilos padrão."""
     
+    __slots__ = (
+        'src', 'alt', 'width', 'height', 'loading', 'cross_origin',
+        'use_map', 'is_map', 'decoding', 'fetch_priority', 'on_load',
+        'on_error'
+    )
+    
+    _attribute_plan = (
+        ('src', 'src', ALWAYS),
+        ('alt', 'alt', ALWAYS),
+        ('loading', 'loading', ALWAYS),
+        ('decoding', 'decoding', ALWAYS),
+        ('width', 'width', IF_NOT_NONE),
+        ('height', 'height', IF_NOT_NONE),
+        ('cross_origin', 'crossOrigin', IF_TRUTHY),
+        ('use_map', 'useMap', IF_TRUTHY),
+        ('is_map', 'isMap', IF_TRUTHY),
+        ('fetch_priority', 'fetchPriority', IF_TRUTHY),
+        ('on_load', 'onLoad', IF_TRUTHY),
+        ('on_error', 'onError', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -1014,41 +1792,52 @@ class Image(BaseComponent):
         self.on_error = kwargs.get('on_error', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        attrs.update({
-            'src': self.src,
-            'alt': self.alt,
-            'loading': self.loading,
-            'decoding': self.decoding
-        })
-        
-        if self.width is not None:
-            attrs['width'] = self.width
-        if self.height is not None:
-            attrs['height'] = self.height
-        if self.cross_origin:
-            attrs['crossOrigin'] = self.cross_origin
-        if self.use_map:
-            attrs['useMap'] = self.use_map
-        if self.is_map:
-            attrs['isMap'] = self.is_map
-        if self.fetch_priority:
-            attrs['fetchPriority'] = self.fetch_priority
-        if self.on_load:
-            attrs['onLoad'] = self.on_load
-        if self.on_error:
-            attrs['onError'] = self.on_error
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'img',
             'attributes': attrs
         }
+    
+    def render_html(self) -> str:
+        attrs = self._serialize_attributes()
+        pairs = []
+        
+        for key in ('src', 'alt'):
+            if attrs.get(key):
+                pairs.append((key, attrs[key]))
+        for key in ('width', 'height'):
+            if key in attrs:
+                pairs.append((key, attrs[key]))
+        for key in ('loading', 'crossOrigin', 'useMap'):
+            if attrs.get(key):
+                pairs.append((key.lower(), attrs[key]))
+        if attrs.get('isMap'):
+            pairs.append(('ismap', True))
+        for key in ('decoding', 'fetchPriority', 'onLoad', 'onError'):
+            if attrs.get(key):
+                pairs.append((key.lower(), attrs[key]))
+        
+        return render_html_element('img', pairs, attrs, void=True)
 
 
 class Link(BaseComponent):
     """Componente Link (anchor) com estilos padrão."""
     
+    __slots__ = (
+        'href', 'target', 'rel', 'download', 'hreflang', 'type',
+        'content'
+    )
+    
+    _attribute_plan = (
+        ('href', 'href', ALWAYS),
+        ('target', 'target', IF_TRUTHY),
+        ('rel', 'rel', IF_TRUTHY),
+        ('download', 'download', IF_TRUTHY),
+        ('hreflang', 'hreflang', IF_TRUTHY),
+        ('type', 'type', IF_TRUTHY),
+    )
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -1062,33 +1851,32 @@ class Link(BaseComponent):
         self.content = kwargs.get('content', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
-        
-        attrs.update({
-            'href': self.href
-        })
-        
-        if self.target:
-            attrs['target'] = self.target
-        if self.rel:
-            attrs['rel'] = self.rel
-        if self.download:
-            attrs['download'] = self.download
-        if self.hreflang:
-            attrs['hreflang'] = self.hreflang
-        if self.type:
-            attrs['type'] = self.type
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'a',
             'attributes': attrs,
             'content': self.content
         }
+    
+    def render_html(self) -> str:
+        attrs = self._serialize_attributes()
+        pairs = []
+        
+        for key in ('href', 'target', 'rel', 'download', 'hreflang', 'type'):
+            if attrs.get(key):
+                pairs.append((key, attrs[key]))
+        
+        return render_html_element(
+            'a', pairs, attrs, _escape_content(self.content)
+        )
 
 
 class Heading(BaseComponent):
     """Componente Heading (h1-h6) com estilos padrão."""
     
+    __slots__ = ('level', 'content')
+    
     def __init__(self, level: int = 1, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -1097,18 +1885,26 @@ class Heading(BaseComponent):
         self.content = kwargs.get('content', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
+        attrs = self._serialize_attributes()
         
         return {
             'type': f'h{self.level}',
             'attributes': attrs,
             'content': self.content
         }
+    
+    def render_html(self) -> str:
+        return render_html_element(
+            f'h{self.level}', [], self._serialize_attributes(), 
+            _escape_content(self.content)
+        )
 
 
 class Paragraph(BaseComponent):
     """Componente Paragraph com estilos padrão."""
     
+    __slots__ = ('content',)
+    
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
         super().__init__(style_provider, style_variant, **kwargs)
@@ -1116,17 +1912,25 @@ class Paragraph(BaseComponent):
         self.content = kwargs.get('content', '')
     
     def to_dict(self) -> Dict[str, Any]:
-        attrs = self._get_base_attributes()
+        attrs = self._serialize_attributes()
         
         return {
             'type': 'p',
             'attributes': attrs,
             'content': self.content
         }
+    
+    def render_html(self) -> str:
+        return render_html_element(
+            'p', [], self._serialize_attributes(), 
+            _escape_content(self.content)
+        )
 
 
 class Page(BaseComponent):
     """Componente Page com estilos padrão."""
+    
+    __slots__ = ('label', 'components', 'layout')
 
     def __init__(self, style_provider: StyleProvider = None, 
                  style_variant: str = None, **kwargs):
@@ -1144,6 +1948,36 @@ class Page(BaseComponent):
                 'components': [component.to_dict() for component in self.components],
             }
         }
+    
+    def _stream_dict(self) -> Dict[str, Any]:
+        return {
+            'page': {
+                'layout': self.layout,
+                'title': self.label,
+                'components': self.components,
+            }
+        }
+    
+    def render_html(self) -> str:
+        """Equivalente a ComponentRenderer.renderPage."""
+        parts = []
+        
+        if self.label:
+            parts.append(
+                '<div class="bg-white rounded-lg shadow-sm border p-6 mb-6">'
+                '<h2 class="text-2xl font-bold text-gray-800">'
+                f'{_escape_content(self.label)}</h2></div>'
+            )
+        
+        layout_class = ''
+        if self.layout:
+            layout_class = PAGE_LAYOUT_CLASSES.get(
+                self.layout, _DEFAULT_PAGE_LAYOUT_CLASS
+            )
+        opening = f'<div class="{layout_class}">' if layout_class else '<div>'
+        parts.append(f'{opening}{_render_children(self.components)}</div>')
+        
+        return ''.join(parts)
 
 
 class InputLabel(Div):
@@ -1153,6 +1987,8 @@ class InputLabel(Div):
     Herda de Div para atuar como o contêiner.
     """
     
+    __slots__ = ()
+    
     def __init__(self, 
                  # Propriedades para o Label
                  label: str,
@@ -1175,7 +2011,11 @@ class InputLabel(Div):
         """
         # 1. Inicializa o Div contêiner. Usamos o estilo 'field_group' 
         # para um espaçamento padrão.
-        super().__init__(style_variant='field_group')
+        super().__init__(
+            style_variant='field_group',
+            static_fragment=kwargs.pop('static_fragment', False),
+            fragment_key=kwargs.pop('fragment_key', None)
+        )
 
         # 2. Determina o ID do input. É crucial para conectar o label.
         #    Se o usuário não passar um 'id', usamos o 'name' como um 
@@ -1238,6 +2078,11 @@ class InputLabel(Div):
 # Exemplo de uso
 def get_example():
     """Exemplo de uso dos componentes."""
+    return get_example_page().to_json()
+
+
+def get_example_page() -> Page:
+    """Monta a página do exemplo de uso dos componentes."""
     # Criando uma página completa
     page = Page(
         label='Formulário de Cadastro',
@@ -1428,11 +2273,16 @@ def get_example():
     # Montando a página
     page.components = [title, description, form]
     
-    return page.to_json()
+    return page
 
 
 def get_simple_example():
     """Exemplo simples de uso dos componentes."""
+    return get_simple_example_page().to_json()
+
+
+def get_simple_example_page() -> Page:
+    """Monta a página do exemplo simples de uso dos componentes."""
     # Página simples
     page = Page(label='Página Simples')
     
@@ -1482,4 +2332,4 @@ def get_simple_example():
     # Montando a página
     page.components = [title, paragraph, link, image, form]
     
-    return page.to_json()
\ No newline at end of file
+    return page
\ No newline at end of file
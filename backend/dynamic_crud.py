@@ -1,26 +1,175 @@
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Annotated, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+import base64
+import codecs
+import copy
+import csv
+import inspect
+import io
+import itertools
+import operator
+import os
+import tempfile
+import time
+import types
 
-from fastapi import APIRouter, Depends, HTTPException, status, FastAPI # Import FastAPI
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel, create_model # Keep Pydantic BaseModel for schemas
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status, FastAPI # Import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model # Keep Pydantic BaseModel for schemas
 from sqlmodel import Field, SQLModel, Session, create_engine, select
+from sqlalchemy import Index, and_, bindparam, delete, event, func, insert, or_, update
+from sqlalchemy import inspect as sa_inspect, select as sa_select, text as sa_text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.sql.schema import Column # Import Column
 from sqlalchemy.sql.sqltypes import Text # Import Text
 import datetime
+import decimal
+import functools
+import hashlib
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from importlib import metadata
+from pathlib import Path
+
+try: # SQLAlchemy's asyncio extension needs greenlet, only required for async mode
+    from sqlmodel.ext.asyncio.session import AsyncSession
+    from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+except ImportError:
+    AsyncSession = AsyncEngine = create_async_engine = None
+
+try: # Only needed for .yaml/.yml resource config files
+    import yaml
+except ImportError:
+    yaml = None
+
+try: # Only needed for validator="msgspec"
+    import msgspec
+except ImportError:
+    msgspec = None
 
 from components import (
     Button, Checkbox, Div, Form, Heading, Input, InputLabel,
-    Label, Page, Select, Span, Textarea, BaseComponent, StyleProvider
+    Label, Page, Select, Span, Textarea, BaseComponent, StyleProvider,
+    JSON_STREAM_CHUNK_SIZE, encode_json
 )
 
 # --- Database Setup (can be customized) ---
 DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(DATABASE_URL, echo=True)
+
+# Async drivers used when an EngineConfig does not set async_url
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+class EngineConfig(BaseModel):
+    url: str = DATABASE_URL
+    async_url: Optional[str] = None # defaults to url with the driver from ASYNC_DRIVERS
+    echo: bool = False # SQL logging is expensive under load, enable it for debugging only
+    
+    # Pooling (None keeps SQLAlchemy's default for the dialect)
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    pool_timeout: Optional[float] = None
+    pool_recycle: int = -1 # seconds before a connection is replaced, -1 disables
+    pool_pre_ping: bool = False # test connections on checkout (for servers that drop idle connections)
+    
+    # SQLite tuning, applied to every new connection
+    sqlite_wal: bool = True # journal_mode=WAL lets readers run alongside a writer
+    sqlite_synchronous: Optional[str] = "NORMAL" # safe with WAL and far fewer fsyncs than FULL
+    sqlite_check_same_thread: bool = False # sessions are used from FastAPI's threadpool
+    
+    connect_args: Dict[str, Any] = Field(default_factory=dict)
+    engine_kwargs: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Keyword arguments to pass directly to create_engine."
+    )
+
+def _engine_kwargs(engine_config: EngineConfig, url: str) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {"echo": engine_config.echo, "pool_pre_ping": engine_config.pool_pre_ping}
+    for option in ("pool_size", "max_overflow", "pool_timeout"):
+        value = getattr(engine_config, option)
+        if value is not None:
+            kwargs[option] = value
+    if engine_config.pool_recycle >= 0:
+        kwargs["pool_recycle"] = engine_config.pool_recycle
+    
+    connect_args = dict(engine_config.connect_args)
+    if make_url(url).get_backend_name() == "sqlite":
+        connect_args.setdefault("check_same_thread", engine_config.sqlite_check_same_thread)
+    if connect_args:
+        kwargs["connect_args"] = connect_args
+    
+    kwargs.update(engine_config.engine_kwargs)
+    return kwargs
+
+def _apply_sqlite_pragmas(sync_engine: Engine, engine_config: EngineConfig) -> None:
+    if sync_engine.dialect.name != "sqlite":
+        return
+    pragmas = []
+    if engine_config.sqlite_wal:
+        pragmas.append("PRAGMA journal_mode=WAL")
+    if engine_config.sqlite_synchronous:
+        pragmas.append(f"PRAGMA synchronous={engine_config.sqlite_synchronous}")
+    if not pragmas:
+        return
+    
+    @event.listens_for(sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+def create_engine_from_config(engine_config: EngineConfig) -> Engine:
+    new_engine = create_engine(engine_config.url, **_engine_kwargs(engine_config, engine_config.url))
+    _apply_sqlite_pragmas(new_engine, engine_config)
+    return new_engine
+
+def create_async_engine_from_config(engine_config: EngineConfig) -> AsyncEngine:
+    if create_async_engine is None:
+        raise RuntimeError("Async mode requires SQLAlchemy's asyncio extension: pip install 'fastsoft[async]'")
+    
+    async_url = engine_config.async_url
+    if async_url is None:
+        url = make_url(engine_config.url)
+        driver = ASYNC_DRIVERS.get(url.get_backend_name())
+        if url.drivername != url.get_backend_name() or driver is None:
+            raise ValueError(f"Cannot derive an async URL from '{engine_config.url}', set EngineConfig.async_url")
+        async_url = url.set(drivername=driver).render_as_string(hide_password=False)
+    
+    new_engine = create_async_engine(async_url, **_engine_kwargs(engine_config, async_url))
+    _apply_sqlite_pragmas(new_engine.sync_engine, engine_config)
+    return new_engine
+
+DEFAULT_ENGINE_CONFIG = EngineConfig()
+engine = create_engine_from_config(DEFAULT_ENGINE_CONFIG)
 
 def get_db():
     with Session(engine) as session:
         yield session
 
+# Async engine (requires aiosqlite for SQLite); created on first use so the
+# driver is only needed when a resource actually runs in async mode.
+_async_engine: Optional[AsyncEngine] = None
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine_from_config(DEFAULT_ENGINE_CONFIG)
+    return _async_engine
+
+async def get_async_db():
+    async with AsyncSession(get_async_engine()) as session:
+        yield session
+
 # --- Field Type Mapping (SQLModel uses Python types directly) ---
 PYTHON_TYPE_MAP = {
     "str": str,
@@ -32,6 +181,10 @@ PYTHON_TYPE_MAP = {
     "enum": str, # For Select with options
 }
 
+# Formats datetimes exactly like the response models do (e.g. UTC as "Z"), for the paths that
+# serialize rows without them (projections, aggregates, exports)
+DATETIME_ADAPTER = TypeAdapter(datetime.datetime)
+
 # SQLModel handles types more directly, so this map is less critical for Field definitions
 # But we keep it for reference or custom type handling if needed.
 SQLMODEL_FIELD_MAP = {
@@ -79,6 +232,7 @@ class FieldConfig(BaseModel):
     options: Optional[Dict[str, str]] = None # For 'enum' types: {"value": "Label"}
     read_only: bool = False
     hidden: bool = False
+    filterable: bool = True # Generate query filters for this field on the list route
     
     # Customization points for form component
     form_component_kwargs: Optional[Dict[str, Any]] = Field(
@@ -98,18 +252,90 @@ class FieldConfig(BaseModel):
         description="Keyword arguments to pass directly to Pydantic Field for schema generation."
     )
 
+class IndexConfig(BaseModel):
+    fields: List[str] # Indexed columns, in order (composite when more than one)
+    name: Optional[str] = None # defaults to ix_{table}_{fields} (uq_ for unique indexes)
+    unique: bool = False
+    where: Optional[str] = None # SQL condition of a partial index (PostgreSQL and SQLite)
+    include: List[str] = [] # Extra columns stored in the index, for covering indexes (PostgreSQL and SQL Server)
+    
+    # Customization points for SQLAlchemy Index (e.g. {"postgresql_using": "brin"})
+    index_kwargs: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Keyword arguments to pass directly to SQLAlchemy Index."
+    )
+
 class DynamicCRUDConfig(BaseModel):
     resource_name: str # e.g., "User", "Product"
     table_name: Optional[str] = None # defaults to resource_name.lower() + "s"
     fields: List[FieldConfig]
+    indexes: List[IndexConfig] = [] # Composite, partial and covering indexes (single columns: FieldConfig.index)
     
     # Customization points
     base_model_class: Type[SQLModel] = SQLModel # Allow custom SQLModel base
-    db_session_dependency: Callable[..., Session] = get_db
+    # Session dependencies; None opens sessions on the manager's engine_name/read_engine_name engines
+    db_session_dependency: Optional[Callable[..., Session]] = None
+    async_db_session_dependency: Optional[Callable[..., AsyncSession]] = None
+    
+    # Named engines registered on the DynamicCRUDManager. Writes use engine_name;
+    # read routes use read_engine_name (e.g. a replica) and fall back to engine_name.
+    engine_name: str = "default"
+    read_engine_name: Optional[str] = None
+    
+    # Serve the generated routes with async handlers over an AsyncSession.
+    # None uses the DynamicCRUDManager default.
+    async_mode: Optional[bool] = None
     
     # Customization for API endpoints
     api_prefix: Optional[str] = None # defaults to /api/{table_name}
     
+    # Create/update/delete with one INSERT/UPDATE ... RETURNING or DELETE statement each,
+    # instead of the ORM's SELECT before and refresh after the write
+    returning_writes: bool = False
+    
+    # Read One and Read All select plain Core rows and encode them straight to JSON, skipping
+    # ORM instances (identity map, attribute instrumentation) and response_model validation
+    core_reads: bool = False
+    
+    # Read-through cache in front of Read One, invalidated by this resource's update, delete
+    # and bulk routes. TTL in seconds (None: entries only leave on invalidation or eviction).
+    # The backend defaults to an in-process LRURowCache of row_cache_max_entries rows.
+    row_cache: bool = False
+    row_cache_ttl: Optional[float] = 60.0
+    row_cache_max_entries: int = 1024
+    row_cache_backend: Optional[Any] = None # a RowCacheBackend, e.g. RedisRowCache(client)
+    
+    # Cache of serialized Read All responses, keyed on the normalized query and the table's
+    # write generation (bumped by every write route of this manager). The TTL bounds staleness
+    # from writes the manager does not see, e.g. other worker processes.
+    list_cache: bool = False
+    list_cache_ttl: Optional[float] = 30.0
+    list_cache_max_entries: int = 256
+    list_cache_backend: Optional[Any] = None # a RowCacheBackend
+    
+    # Validation of Create/Update payloads (item, bulk and import routes): "pydantic" (the
+    # generated schemas) or "msgspec" (Structs generated from the same fields, faster for
+    # high-volume writes; needs msgspec installed)
+    validator: str = "pydantic"
+    
+    # Rows written per transaction by the /bulk routes
+    bulk_chunk_size: int = 500
+    
+    # Rows fetched from the server-side cursor per batch by the /export route
+    export_batch_size: int = 1000
+    
+    # Seconds an unfiltered /count?approximate=true result is reused (on PostgreSQL it comes
+    # from the planner statistics instead of a COUNT(*) over the whole table)
+    approximate_count_ttl: float = 60.0
+    
+    # Groups returned by one /aggregate request at most
+    aggregate_max_groups: int = 1000
+    
+    # Read All paging: "offset" (skip/limit) or "keyset" (cursor/limit/order_by, returns a Page
+    # with next_cursor). Keyset pages can be ordered by the primary key or any non-nullable
+    # indexed or unique field.
+    pagination: str = "offset"
+    
     # FastAPI router customization
     router_kwargs: Optional[Dict[str, Any]] = Field(
         default_factory=dict,
@@ -130,7 +356,49 @@ class DynamicCRUDConfig(BaseModel):
     # Allow adding extra components to the form
     extra_form_components: Optional[List[Dict[str, Any]]] = None # JSON-like representation of components
 
+    # Cache-Control sent (together with a strong ETag) by the form endpoints.
+    # "no-cache" lets clients keep the payload but revalidate it with If-None-Match.
+    cache_control: Optional[str] = "no-cache"
+
+def _fingerprint_default(value: Any) -> str:
+    # Classes and callables (base_model_class, db_session_dependency, ...) are
+    # identified by their import path rather than their repr.
+    qualname = getattr(value, "__qualname__", None)
+    if qualname is not None:
+        return f"{getattr(value, '__module__', '')}.{qualname}"
+    # Instances without a repr of their own (e.g. row_cache_backend) by their class: the
+    # default repr holds a memory address, which would change the fingerprint every process
+    value_type = type(value)
+    if value_type.__repr__ is object.__repr__:
+        return f"{value_type.__module__}.{value_type.__qualname__}()"
+    return repr(value)
+
+def config_fingerprint(config: DynamicCRUDConfig) -> str:
+    """Stable hash of a resource configuration, used to key derived caches."""
+    serialized = json.dumps(config.model_dump(), sort_keys=True, default=_fingerprint_default)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
 # --- Dynamic SQLModel Generation ---
+def generate_index(config: DynamicCRUDConfig, table_name: str, index: IndexConfig) -> Index:
+    field_names = {field.name for field in config.fields}
+    unknown = [name for name in (*index.fields, *index.include) if name not in field_names]
+    if not index.fields or unknown:
+        raise ValueError(f"Index on '{table_name}' needs fields of the resource, got unknown fields: {', '.join(unknown) or '(none)'}")
+    
+    index_kwargs: Dict[str, Any] = {}
+    if index.where:
+        index_kwargs["postgresql_where"] = sa_text(index.where)
+        index_kwargs["sqlite_where"] = sa_text(index.where)
+    if index.include:
+        index_kwargs["postgresql_include"] = list(index.include)
+        index_kwargs["mssql_include"] = list(index.include)
+    index_kwargs.update(index.index_kwargs)
+    
+    name = index.name or f"{'uq' if index.unique else 'ix'}_{table_name}_{'_'.join(index.fields)}"
+    return Index(name, *index.fields, unique=index.unique, **index_kwargs)
+
+_model_generations = itertools.count()
+
 def generate_sqlmodel(config: DynamicCRUDConfig) -> Type[SQLModel]:
     table_name = config.table_name or f"{config.resource_name.lower()}s"
     model_name = config.resource_name
@@ -172,13 +440,22 @@ def generate_sqlmodel(config: DynamicCRUDConfig) -> Type[SQLModel]:
         elif not field.nullable and not field.primary_key:
             # Required field without default - use Ellipsis
             field_kwargs["default"] = ...
+        else:
+            # Nullable and primary key fields (the database assigns the key) default to None
+            field_kwargs["default"] = None
         
         # Handle max_length for strings
         if field.type == "str" and field.max_length:
             field_kwargs["max_length"] = field.max_length
         elif field.type == "text":
-            field_kwargs["sa_column"] = Column(Text)
-            field_kwargs.pop("nullable", None)
+            # SQLModel rejects column options next to sa_column, so they go on the Column itself
+            field_kwargs["sa_column"] = Column(
+                Text,
+                nullable=field_kwargs.pop("nullable"),
+                index=field_kwargs.pop("index"),
+                unique=field_kwargs.pop("unique"),
+            )
+            field_kwargs.pop("primary_key")
         
         # Add any custom SQLModel field kwargs
         field_kwargs.update(field.sqlmodel_field_kwargs)
@@ -188,9 +465,20 @@ def generate_sqlmodel(config: DynamicCRUDConfig) -> Type[SQLModel]:
     
     # Add annotations to the namespace
     class_namespace["__annotations__"] = annotations
+    # A module of its own, so a resource registered again (replaced or retried after an error)
+    # is not a duplicate of the previous class in SQLAlchemy's class registry
+    class_namespace["__module__"] = f"{__name__}.models.m{next(_model_generations)}"
+    
+    if config.indexes:
+        class_namespace["__table_args__"] = tuple(generate_index(config, table_name, index) for index in config.indexes)
     
-    # Create the model class
-    return type(model_name, (config.base_model_class,), class_namespace)
+    # Create the model class (table=True so SQLModel maps it to a table)
+    return types.new_class(
+        model_name,
+        (config.base_model_class,),
+        {"table": True},
+        lambda namespace: namespace.update(class_namespace),
+    )
 
 # --- Dynamic Pydantic Schema Generation ---
 def generate_pydantic_schemas(config: DynamicCRUDConfig, sql_model: Type[SQLModel]) -> Dict[str, Type[BaseModel]]:
@@ -224,7 +512,9 @@ def generate_pydantic_schemas(config: DynamicCRUDConfig, sql_model: Type[SQLMode
                 field_kwargs["default"] = ...
         elif not field_config.nullable and for_creation:
             # Required field for creation
-            if field_config.default is not None:
+            if field_config.type == "datetime" and field_config.default == "now":
+                field_kwargs["default_factory"] = datetime.datetime.now
+            elif field_config.default is not None:
                 field_kwargs["default"] = field_config.default
             else:
                 field_kwargs["default"] = ...
@@ -232,6 +522,10 @@ def generate_pydantic_schemas(config: DynamicCRUDConfig, sql_model: Type[SQLMode
             # Optional field
             field_kwargs["default"] = None
         
+        # Payloads are validated only by these schemas, so they carry the column's length limit
+        if (for_creation or for_update) and field_config.type == "str" and field_config.max_length:
+            field_kwargs.setdefault("max_length", field_config.max_length)
+        
         return (type_annotation, Field(**field_kwargs))
     
     # Base Schema (for reading data from DB and response models)
@@ -266,16 +560,1049 @@ def generate_pydantic_schemas(config: DynamicCRUDConfig, sql_model: Type[SQLMode
     
     schemas["Update"] = create_model(f"{config.resource_name}Update", **update_fields)
     
+    # Page Schema (for keyset-paginated Read All responses)
+    schemas["Page"] = create_model(
+        f"{config.resource_name}Page",
+        items=(List[BaseSchema], ...),
+        next_cursor=(Optional[str], None),
+    )
+    
     return schemas
 
+# --- Payload Validation ---
+VALIDATORS = ("pydantic", "msgspec")
+
+def generate_msgspec_structs(config: DynamicCRUDConfig) -> Dict[str, type]:
+    """Create and Update payloads as msgspec Structs, with the fields, defaults and length limits of the pydantic schemas."""
+    if msgspec is None:
+        raise ValueError(f"Resource '{config.resource_name}' uses validator='msgspec', which needs the msgspec package (fastsoft[msgspec])")
+    create_fields = []
+    update_fields = []
+    for field_config in config.fields:
+        if field_config.primary_key or field_config.read_only or field_config.hidden:
+            continue
+        py_type = PYTHON_TYPE_MAP.get(field_config.type)
+        if py_type is None:
+            raise ValueError(f"Unknown Python type for field '{field_config.name}': {field_config.type}")
+        if field_config.type == "str" and field_config.max_length:
+            py_type = Annotated[py_type, msgspec.Meta(max_length=field_config.max_length)]
+
+        if field_config.nullable:
+            create_fields.append((field_config.name, Optional[py_type], None))
+        elif field_config.type == "datetime" and field_config.default == "now":
+            create_fields.append((field_config.name, py_type, msgspec.field(default_factory=datetime.datetime.now)))
+        elif field_config.default is not None:
+            create_fields.append((field_config.name, py_type, field_config.default))
+        else:
+            create_fields.append((field_config.name, py_type))
+        # UNSET tells fields left out of a partial update from explicit nulls (exclude_unset)
+        update_fields.append((field_config.name, Union[py_type, None, msgspec.UnsetType], msgspec.UNSET))
+
+    return {
+        "Create": msgspec.defstruct(f"{config.resource_name}CreateStruct", create_fields, kw_only=True),
+        "Update": msgspec.defstruct(f"{config.resource_name}UpdateStruct", update_fields, kw_only=True),
+    }
+
+# Raised by PayloadValidator.create/update for invalid payloads
+PAYLOAD_VALIDATION_ERRORS: Tuple[type, ...] = (ValidationError,)
+if msgspec is not None:
+    PAYLOAD_VALIDATION_ERRORS += (msgspec.ValidationError,)
+
+class PayloadValidator:
+    """
+    Validates Create and Update payloads once and returns the values to write.
+
+    Without `structs` the generated pydantic schemas validate (and FastAPI validates the request
+    bodies of the item routes). With the Structs of generate_msgspec_structs, msgspec validates
+    instead and the item routes decode their bodies with it; the pydantic schemas still describe
+    the request bodies in OpenAPI.
+    """
+    def __init__(self, schemas: Dict[str, Type[BaseModel]], structs: Optional[Dict[str, type]] = None):
+        self.schemas = schemas
+        self.structs = structs
+
+    @staticmethod
+    def _struct_values(item: Any) -> Dict[str, Any]:
+        return {name: value for name, value in msgspec.structs.asdict(item).items() if value is not msgspec.UNSET}
+
+    def create(self, raw: Any) -> Dict[str, Any]:
+        if self.structs is None:
+            return self.schemas["Create"].model_validate(raw).model_dump()
+        return self._struct_values(msgspec.convert(raw, self.structs["Create"], strict=False))
+
+    def update(self, raw: Any) -> Dict[str, Any]:
+        """Only the fields present in the payload."""
+        if self.structs is None:
+            return self.schemas["Update"].model_validate(raw).model_dump(exclude_unset=True)
+        return self._struct_values(msgspec.convert(raw, self.structs["Update"], strict=False))
+
+    def values(self, item: Any, partial: bool = False) -> Dict[str, Any]:
+        """Values of a payload the route already validated (a schema instance, or a dict from body())."""
+        if isinstance(item, BaseModel):
+            return item.model_dump(exclude_unset=partial)
+        return item
+
+    def body(self, kind: str) -> Tuple[Any, Any, Dict[str, Any]]:
+        """(annotation, default, route kwargs) of the `item` parameter of the Create or Update route."""
+        schema = self.schemas[kind]
+        if self.structs is None:
+            return schema, Body(...), {}
+        struct = self.structs[kind]
+
+        async def decode_body(request: Request) -> Dict[str, Any]:
+            try:
+                item = msgspec.json.decode(await request.body(), type=struct, strict=False)
+            except msgspec.ValidationError as exc:
+                raise RequestValidationError([{"type": "value_error", "loc": ("body",), "msg": str(exc), "input": None}])
+            except msgspec.DecodeError as exc:
+                raise RequestValidationError([{"type": "json_invalid", "loc": ("body", 0), "msg": "JSON decode error",
+                                               "input": {}, "ctx": {"error": str(exc)}}])
+            return self._struct_values(item)
+
+        request_body = {"required": True, "content": {"application/json": {"schema": schema.model_json_schema()}}}
+        return Dict[str, Any], Depends(decode_body), {"openapi_extra": {"requestBody": request_body}}
+
+def table_defaults(sql_model: Type[SQLModel], schema: Type[BaseModel], pk_name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Completes validated Create values into a row for a Core INSERT with the table model's
+    defaults (e.g. default_factory) for the fields the schema leaves out, such as read-only and
+    hidden ones. The primary key is left to the database.
+    """
+    defaults = [
+        (name, field) for name, field in sql_model.model_fields.items()
+        if name not in schema.model_fields and name != pk_name and not field.is_required()
+    ]
+
+    def complete(values: Dict[str, Any]) -> Dict[str, Any]:
+        for name, field in defaults:
+            values[name] = field.get_default(call_default_factory=True)
+        return values
+    return complete
+
+# --- Keyset Pagination ---
+PAGINATION_MODES = ("offset", "keyset")
+
+def encode_cursor(order_by: str, values: List[Any]) -> str:
+    """Packs the sort key and the last row's sort values into an opaque URL-safe token."""
+    payload = json.dumps([order_by, values], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+def decode_cursor(cursor: str) -> Tuple[str, List[Any]]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        order_by, values = json.loads(payload)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    if not isinstance(order_by, str) or not isinstance(values, list):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return order_by, values
+
+class KeysetPaginator:
+    """
+    Pages through a table with `WHERE (sort, pk) > (last sort, last pk) ORDER BY sort, pk LIMIT n`,
+    so every page costs an index seek no matter how deep it is, unlike OFFSET.
+    """
+    def __init__(self, config: DynamicCRUDConfig, sql_model: Type[SQLModel], pk_field_config: FieldConfig):
+        self.sql_model = sql_model
+        self.pk_field_config = pk_field_config
+        # Not hidden fields: the cursor carries the last row's sort value, and the order itself
+        # would leak the values
+        self.sort_fields = {
+            field.name: field for field in config.fields
+            if field.primary_key or ((field.index or field.unique) and not field.nullable and not field.hidden)
+        }
+
+    def parse_order_by(self, order_by: Optional[str]) -> Tuple[FieldConfig, bool]:
+        order_by = order_by or self.pk_field_config.name
+        descending = order_by.startswith("-")
+        field = self.sort_fields.get(order_by.lstrip("-"))
+        if field is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot order by '{order_by}'. Sortable fields: {', '.join(self.sort_fields)}"
+            )
+        return field, descending
+
+    def _coerce(self, field: FieldConfig, value: Any) -> Any:
+        try:
+            if field.type == "datetime":
+                return datetime.datetime.fromisoformat(value)
+            return PYTHON_TYPE_MAP[field.type](value)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    def fetch_page(self, db: Session, limit: int, cursor: Optional[str] = None, order_by: Optional[str] = None,
+                   conditions: Optional[List[Any]] = None, columns: Optional[List[str]] = None) -> Dict[str, Any]:
+        field, descending = self.parse_order_by(order_by)
+        order_key = ("-" if descending else "") + field.name
+        sort_column = getattr(self.sql_model, field.name)
+        pk_column = getattr(self.sql_model, self.pk_field_config.name)
+        key_fields = [field] if field.primary_key else [field, self.pk_field_config]
+        key_columns = [getattr(self.sql_model, key_field.name) for key_field in key_fields]
+        
+        if columns:
+            # The key columns are always read, the next cursor is built from them
+            selected = dict.fromkeys([*(key_field.name for key_field in key_fields), *columns])
+            statement = sa_select(*(getattr(self.sql_model, name) for name in selected))
+        else:
+            statement = select(self.sql_model)
+        if conditions:
+            statement = statement.where(*conditions)
+        if cursor:
+            cursor_order_key, values = decode_cursor(cursor)
+            if cursor_order_key != order_key or len(values) != len(key_fields):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor does not match order_by")
+            values = [self._coerce(key_field, value) for key_field, value in zip(key_fields, values)]
+            
+            if field.primary_key:
+                condition = pk_column < values[0] if descending else pk_column > values[0]
+            elif descending:
+                condition = or_(sort_column < values[0], and_(sort_column == values[0], pk_column < values[1]))
+            else:
+                condition = or_(sort_column > values[0], and_(sort_column == values[0], pk_column > values[1]))
+            statement = statement.where(condition)
+        
+        statement = statement.order_by(*(column.desc() if descending else column.asc() for column in key_columns))
+        # One extra row tells whether another page exists without a COUNT query
+        items = db.exec(statement.limit(limit + 1)).all()
+        
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(order_key, [getattr(last, key_field.name) for key_field in key_fields])
+        return {"items": items, "next_cursor": next_cursor}
+
+# --- List Query Parameters ---
+RESERVED_QUERY_PARAMETERS = (
+    "db", "skip", "limit", "cursor", "order_by", "sort", "fields", "approximate", "metric", "group_by", "export_format"
+)
+
+class ListQuery:
+    """
+    Generates filter, sort and projection query parameters for a list route from the
+    FieldConfigs and pushes them down into the SELECT:
+    
+    - `name=value`, `name__in=a&name__in=b`
+    - `name__gt`, `__gte`, `__lt`, `__lte` for int, float and datetime fields
+    - `name__startswith=prefix` for str and text fields
+    - `sort=-name,id` on the primary key and indexed or unique fields
+    - `fields=id,name` to read and return only those columns
+    """
+    RANGE_TYPES = ("int", "float", "datetime")
+    PREFIX_TYPES = ("str", "text")
+    RANGE_OPERATORS = {"gt": operator.gt, "gte": operator.ge, "lt": operator.lt, "lte": operator.le}
+
+    def __init__(self, config: DynamicCRUDConfig, sql_model: Type[SQLModel]):
+        self.sql_model = sql_model
+        visible_fields = [field for field in config.fields if field.primary_key or not field.hidden]
+        self.pk_name = next(field.name for field in config.fields if field.primary_key)
+        self.field_names = [field.name for field in visible_fields]
+        self.sort_fields = [field.name for field in visible_fields if field.primary_key or field.index or field.unique]
+        self.datetime_fields = [field.name for field in visible_fields if field.type == "datetime"]
+        self.datetime_adapter = DATETIME_ADAPTER
+        
+        self.filters: Dict[str, Tuple[str, str]] = {} # query parameter -> (field name, operator)
+        self.parameters: List[inspect.Parameter] = []
+        for field in visible_fields:
+            if not field.filterable:
+                continue
+            if field.name in RESERVED_QUERY_PARAMETERS:
+                raise ValueError(
+                    f"Field '{field.name}' clashes with the list/count/aggregate/export route parameter of the same name, set filterable=False"
+                )
+            py_type = PYTHON_TYPE_MAP[field.type]
+            self._add_filter(field.name, field.name, "eq", Optional[py_type])
+            if field.type != "bool":
+                self._add_filter(f"{field.name}__in", field.name, "in", Optional[List[py_type]], Query(None))
+            if field.type in self.RANGE_TYPES:
+                for op in self.RANGE_OPERATORS:
+                    self._add_filter(f"{field.name}__{op}", field.name, op, Optional[py_type])
+            if field.type in self.PREFIX_TYPES:
+                self._add_filter(f"{field.name}__startswith", field.name, "startswith", Optional[str])
+
+    def _add_filter(self, parameter: str, field_name: str, op: str, annotation: Any, default: Any = None):
+        self.filters[parameter] = (field_name, op)
+        self.parameters.append(
+            inspect.Parameter(parameter, inspect.Parameter.KEYWORD_ONLY, default=default, annotation=annotation)
+        )
+
+    def with_filter_parameters(self, operation: Callable[..., Any]) -> Callable[..., Any]:
+        """Replaces the `**filters` of an operation's signature with the generated filter parameters."""
+        signature = inspect.signature(operation)
+        params = [param for param in signature.parameters.values() if param.kind != inspect.Parameter.VAR_KEYWORD]
+        operation.__signature__ = signature.replace(parameters=[*params, *self.parameters])
+        return operation
+
+    def conditions(self, filters: Dict[str, Any]) -> List[Any]:
+        conditions = []
+        for parameter, value in filters.items():
+            if value is None:
+                continue
+            field_name, op = self.filters[parameter]
+            column = getattr(self.sql_model, field_name)
+            if op == "eq":
+                conditions.append(column == value)
+            elif op == "in":
+                conditions.append(column.in_(value))
+            elif op == "startswith":
+                conditions.append(column.startswith(value, autoescape=True))
+            else:
+                conditions.append(self.RANGE_OPERATORS[op](column, value))
+        return conditions
+
+    def order_by(self, sort: Optional[str]) -> List[Any]:
+        if not sort:
+            return []
+        clauses = []
+        names = []
+        for key in filter(None, (part.strip() for part in sort.split(","))):
+            name = key.lstrip("-")
+            if name not in self.sort_fields:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Cannot sort by '{name}'. Sortable fields: {', '.join(self.sort_fields)}"
+                )
+            column = getattr(self.sql_model, name)
+            clauses.append(column.desc() if key.startswith("-") else column.asc())
+            names.append(name)
+        if self.pk_name not in names:
+            # Tie-breaker so equal sort values come back in a stable order across pages
+            clauses.append(getattr(self.sql_model, self.pk_name).asc())
+        return clauses
+
+    def parse_fields(self, fields: Optional[str]) -> Optional[List[str]]:
+        if not fields:
+            return None
+        columns = list(dict.fromkeys(filter(None, (name.strip() for name in fields.split(",")))))
+        unknown = [name for name in columns if name not in self.field_names]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}. Available fields: {', '.join(self.field_names)}"
+            )
+        return columns or None
+
+    def select(self, columns: Optional[List[str]] = None):
+        if columns:
+            # SQLAlchemy's select: SQLModel's would make Session.exec return bare values for one column
+            return sa_select(*(getattr(self.sql_model, name) for name in columns))
+        return select(self.sql_model)
+
+    def project(self, rows: List[Any], columns: List[str]) -> List[Dict[str, Any]]:
+        """Turns selected rows into plain dicts holding only the requested columns, ready for encode_json."""
+        items = []
+        for row in rows:
+            item = {name: getattr(row, name) for name in columns}
+            for name in self.datetime_fields:
+                if item.get(name) is not None:
+                    item[name] = self.datetime_adapter.dump_python(item[name], mode="json")
+            items.append(item)
+        return items
+
+# --- Aggregation ---
+AGGREGATE_FUNCTIONS = {"count": func.count, "sum": func.sum, "avg": func.avg, "min": func.min, "max": func.max}
+
+class CountResult(BaseModel):
+    count: int
+    approximate: bool = False
+
+class Aggregator:
+    """
+    Parses the /aggregate route's parameters into one SELECT ... GROUP BY, filtered like the
+    list route:
+    
+    - `metric=count`, `metric=count:name` (non-null values), `metric=sum:price`, `avg`, `min`, `max`
+    - sum and avg on int and float fields, min and max on int, float and datetime fields
+    - `group_by=status,owner_id` on the primary key and indexed or unique fields
+    
+    Each result row holds the group_by fields and one `function` or `function_field` key per metric.
+    """
+    NUMERIC_TYPES = ("int", "float")
+    ORDERED_TYPES = ("int", "float", "datetime")
+
+    def __init__(self, config: DynamicCRUDConfig, sql_model: Type[SQLModel]):
+        self.sql_model = sql_model
+        visible_fields = [field for field in config.fields if field.primary_key or not field.hidden]
+        indexed = {name for index in config.indexes for name in index.fields}
+        self.field_names = [field.name for field in visible_fields]
+        self.group_fields = [
+            field.name for field in visible_fields
+            if field.primary_key or field.index or field.unique or field.name in indexed
+        ]
+        numeric = [field.name for field in visible_fields if field.type in self.NUMERIC_TYPES]
+        ordered = [field.name for field in visible_fields if field.type in self.ORDERED_TYPES]
+        self.metric_fields = {"count": self.field_names, "sum": numeric, "avg": numeric, "min": ordered, "max": ordered}
+        self.datetime_fields = [field.name for field in visible_fields if field.type == "datetime"]
+        self.datetime_adapter = DATETIME_ADAPTER
+
+    def parse_metrics(self, metrics: List[str]) -> List[Tuple[str, str, Optional[str]]]:
+        """Returns (label, function, field name or None) per metric, in request order."""
+        parsed = {}
+        for metric in metrics:
+            name, _, field_name = metric.strip().partition(":")
+            field_name = field_name.strip() or None
+            if name not in AGGREGATE_FUNCTIONS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown metric '{name}'. Available metrics: {', '.join(AGGREGATE_FUNCTIONS)}"
+                )
+            if field_name is None and name != "count":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Metric '{name}' needs a field, e.g. '{name}:field'"
+                )
+            if field_name is not None and field_name not in self.metric_fields[name]:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Cannot compute '{name}' of '{field_name}'. Fields: {', '.join(self.metric_fields[name])}"
+                )
+            label = f"{name}_{field_name}" if field_name else name
+            parsed[label] = (label, name, field_name)
+        return list(parsed.values())
+
+    def parse_group_by(self, group_by: Optional[str]) -> List[str]:
+        if not group_by:
+            return []
+        names = list(dict.fromkeys(filter(None, (name.strip() for name in group_by.split(",")))))
+        for name in names:
+            if name not in self.group_fields:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Cannot group by '{name}'. Groupable fields: {', '.join(self.group_fields)}"
+                )
+        return names
+
+    def select(self, metrics: List[Tuple[str, str, Optional[str]]], group_by: List[str], conditions: List[Any]):
+        group_columns = [getattr(self.sql_model, name) for name in group_by]
+        aggregates = []
+        for label, name, field_name in metrics:
+            if field_name is None:
+                aggregates.append(func.count().label(label))
+            else:
+                aggregates.append(AGGREGATE_FUNCTIONS[name](getattr(self.sql_model, field_name)).label(label))
+        statement = sa_select(*group_columns, *aggregates).select_from(self.sql_model)
+        if conditions:
+            statement = statement.where(*conditions)
+        if group_columns:
+            statement = statement.group_by(*group_columns).order_by(*group_columns)
+        return statement
+
+    def project(self, rows: List[Any], group_by: List[str], labels: List[str]) -> List[Dict[str, Any]]:
+        items = []
+        for row in rows:
+            item = dict(zip([*group_by, *labels], row))
+            for key, value in item.items():
+                if isinstance(value, decimal.Decimal): # e.g. AVG/SUM on PostgreSQL NUMERIC
+                    item[key] = float(value)
+                elif isinstance(value, datetime.datetime):
+                    item[key] = self.datetime_adapter.dump_python(value, mode="json")
+            items.append(item)
+        return items
+
+class ApproximateCount:
+    """
+    Row count of a whole table, reused for `ttl` seconds. On PostgreSQL it is read from the
+    planner statistics (pg_class.reltuples, kept up to date by ANALYZE/autovacuum) instead of
+    a COUNT(*) that scans the table; other databases count once per TTL.
+    """
+    
+    def __init__(self, sql_model: Type[SQLModel], ttl: float):
+        self.sql_model = sql_model
+        self.ttl = ttl
+        self._value: Optional[int] = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> int:
+        with self._lock:
+            if self._value is not None and time.monotonic() < self._expires:
+                return self._value
+        value = self._estimate(db)
+        with self._lock:
+            self._value = value
+            self._expires = time.monotonic() + self.ttl
+        return value
+
+    def _estimate(self, db: Session) -> int:
+        table = self.sql_model.__table__
+        if db.get_bind().dialect.name == "postgresql":
+            estimate = db.exec(
+                sa_text("SELECT reltuples FROM pg_class WHERE oid = CAST(:name AS regclass)"),
+                params={"name": table.fullname},
+            ).scalar()
+            if estimate is not None and estimate >= 0: # -1: never analyzed
+                return int(estimate)
+        return db.exec(sa_select(func.count()).select_from(table)).scalar_one()
+
+# --- Row Cache ---
+class RowCacheBackend(ABC):
+    """Storage for the row and list caches. Values are encoded JSON response bodies."""
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        ...
+
+class LRURowCache(RowCacheBackend):
+    """In-process, thread-safe LRU cache with per-entry expiry."""
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[str, Tuple[Optional[float], bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+class RedisRowCache(RowCacheBackend):
+    """
+    Keeps rows in a Redis-compatible server through any client with redis-py's
+    get/set(px=)/delete/scan_iter methods. Expiry and eviction are the server's job, so
+    only hits and misses are counted here.
+    """
+    def __init__(self, client: Any, prefix: str = "rowcache:"):
+        self.client = client
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.client.get(self.prefix + key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            self.client.set(self.prefix + key, value)
+        else:
+            self.client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+class TableGenerations:
+    """Per-table write counters; caches that put the generation in their keys are invalidated by a bump."""
+    def __init__(self):
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, table_name: str) -> int:
+        return self._generations.get(table_name, 0)
+
+    def bump(self, table_name: str) -> int:
+        with self._lock:
+            generation = self._generations.get(table_name, 0) + 1
+            self._generations[table_name] = generation
+            return generation
+
+# --- Prepared Statements ---
+class ResourceStatements:
+    """
+    The primary-key statements of a resource, built once at registration with bound parameters.
+    Reusing the same statement objects skips rebuilding them per request and lets SQLAlchemy
+    answer from its compiled cache without recomputing the cache key. The key is bound as
+    `_pk`; UPDATE and INSERT take their SET/VALUES columns from the parameters they are executed with.
+    `row_columns` are the columns Core reads return (all of them by default).
+    """
+    def __init__(self, sql_model: Type[SQLModel], pk_name: str, row_columns: Optional[List[str]] = None):
+        table = sql_model.__table__
+        pk_column = table.c[pk_name]
+        by_pk = pk_column == bindparam("_pk")
+        self.select_by_pk = select(sql_model).where(by_pk)
+        self.select_row_by_pk = sa_select(*(table.c[name] for name in row_columns or table.c.keys())).where(by_pk)
+        self.existing_keys = select(pk_column).where(pk_column.in_(bindparam("keys", expanding=True)))
+        self.insert = insert(table)
+        self.insert_returning = insert(table).returning(*table.c)
+        self.update_by_pk = update(table).where(by_pk)
+        self.update_returning = update(table).where(by_pk).returning(*table.c)
+        self.delete_by_pk = delete(table).where(by_pk)
+        self.delete_by_keys = delete(table).where(pk_column.in_(bindparam("keys", expanding=True)))
+
+# --- Bulk Writes ---
+class BulkItemError(BaseModel):
+    index: int # Position of the item in the request body
+    detail: Any
+
+class BulkResult(BaseModel):
+    processed: int
+    errors: List[BulkItemError] = []
+
+class BulkWriter:
+    """
+    Validates a list of items one by one and writes the valid ones with one executemany
+    statement and one transaction per chunk. If a chunk fails in the database, its rows are
+    retried one at a time so the error is reported against the item that caused it.
+    """
+    def __init__(self, sql_model: Type[SQLModel], schemas: Dict[str, Type[BaseModel]], pk_name: str, pk_type: type,
+                 chunk_size: int, statements: Optional[ResourceStatements] = None,
+                 validator: Optional[PayloadValidator] = None):
+        if chunk_size < 1:
+            raise ValueError(f"bulk_chunk_size must be at least 1, got {chunk_size}")
+        self.sql_model = sql_model
+        self.table = sql_model.__table__
+        self.schemas = schemas
+        self.pk_name = pk_name
+        self.pk_column = self.table.c[pk_name]
+        self.pk_adapter = TypeAdapter(pk_type)
+        self.chunk_size = chunk_size
+        self.statements = statements or ResourceStatements(sql_model, pk_name)
+        self.validator = validator or PayloadValidator(schemas)
+        self.complete_row = table_defaults(sql_model, schemas["Create"], pk_name)
+
+    @staticmethod
+    def _validation_error(index: int, exc: Exception) -> BulkItemError:
+        if isinstance(exc, ValidationError):
+            return BulkItemError(index=index, detail=json.loads(exc.json(include_url=False)))
+        return BulkItemError(index=index, detail=str(exc))
+
+    def _write(self, db: Session, rows: List[Tuple[int, Any]], write_chunk: Callable[[Session, List[Any]], None],
+               errors: List[BulkItemError]) -> int:
+        written = 0
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = rows[start:start + self.chunk_size]
+            try:
+                write_chunk(db, [payload for _, payload in chunk])
+                db.commit()
+                written += len(chunk)
+                continue
+            except SQLAlchemyError:
+                db.rollback()
+            for index, payload in chunk:
+                try:
+                    write_chunk(db, [payload])
+                    db.commit()
+                    written += 1
+                except SQLAlchemyError as exc:
+                    db.rollback()
+                    errors.append(BulkItemError(index=index, detail=str(exc.orig or exc)))
+        return written
+
+    def _existing_keys(self, db: Session, keys: List[Any]) -> set:
+        existing = set()
+        for start in range(0, len(keys), self.chunk_size):
+            chunk = keys[start:start + self.chunk_size]
+            existing.update(db.exec(self.statements.existing_keys, params={"keys": chunk}).all())
+        return existing
+
+    def create(self, db: Session, items: List[Dict[str, Any]]) -> BulkResult:
+        errors: List[BulkItemError] = []
+        written = self.create_indexed(db, list(enumerate(items)), errors)
+        return BulkResult(processed=written, errors=sorted(errors, key=lambda error: error.index))
+
+    def create_indexed(self, db: Session, items: List[Tuple[int, Any]], errors: List[BulkItemError]) -> int:
+        """Validates and inserts (index, payload) pairs, appending failures to `errors`; returns the rows written."""
+        rows = []
+        for index, raw in items:
+            try:
+                row = self.complete_row(self.validator.create(raw))
+            except PAYLOAD_VALIDATION_ERRORS as exc:
+                errors.append(self._validation_error(index, exc))
+                continue
+            rows.append((index, row))
+        
+        def write_chunk(db: Session, chunk: List[Dict[str, Any]]):
+            db.connection().execute(self.statements.insert, chunk)
+        
+        return self._write(db, rows, write_chunk, errors)
+
+    def update(self, db: Session, items: List[Dict[str, Any]]) -> BulkResult:
+        errors: List[BulkItemError] = []
+        rows = []
+        for index, raw in enumerate(items):
+            if not isinstance(raw, dict) or raw.get(self.pk_name) is None:
+                errors.append(BulkItemError(index=index, detail=f"Missing primary key '{self.pk_name}'"))
+                continue
+            fields = {key: value for key, value in raw.items() if key != self.pk_name}
+            try:
+                item_id = self.pk_adapter.validate_python(raw[self.pk_name])
+                values = self.validator.update(fields)
+            except PAYLOAD_VALIDATION_ERRORS as exc:
+                errors.append(self._validation_error(index, exc))
+                continue
+            rows.append((index, {"_pk": item_id, **values}))
+        
+        existing = self._existing_keys(db, [row["_pk"] for _, row in rows])
+        found = []
+        for index, row in rows:
+            if row["_pk"] in existing:
+                found.append((index, row))
+            else:
+                errors.append(BulkItemError(index=index, detail="Not found"))
+        
+        def write_chunk(db: Session, chunk: List[Dict[str, Any]]):
+            # executemany needs the same SET columns for every row, so group rows by column set
+            groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+            for row in chunk:
+                groups.setdefault(tuple(sorted(row)), []).append(row)
+            groups.pop(("_pk",), None) # Nothing to set
+            for group in groups.values():
+                db.connection().execute(self.statements.update_by_pk, group)
+        
+        written = self._write(db, found, write_chunk, errors)
+        return BulkResult(processed=written, errors=sorted(errors, key=lambda error: error.index))
+
+    def delete(self, db: Session, ids: List[Any]) -> BulkResult:
+        errors: List[BulkItemError] = []
+        first_indexes: Dict[Any, int] = {}
+        for index, item_id in enumerate(ids):
+            first_indexes.setdefault(item_id, index) # A repeated id is deleted (and counted) once
+        existing = self._existing_keys(db, list(first_indexes))
+        rows = []
+        for item_id, index in first_indexes.items():
+            if item_id in existing:
+                rows.append((index, item_id))
+            else:
+                errors.append(BulkItemError(index=index, detail="Not found"))
+        
+        def write_chunk(db: Session, chunk: List[Any]):
+            db.connection().execute(self.statements.delete_by_keys, {"keys": chunk})
+        
+        written = self._write(db, rows, write_chunk, errors)
+        return BulkResult(processed=written, errors=sorted(errors, key=lambda error: error.index))
+
+# --- Import ---
+IMPORT_MAX_REPORTED_ERRORS = 1000 # Errors beyond this are counted in `failed` but not listed
+
+class ImportResult(BulkResult):
+    rows: int # Data rows read from the upload
+    failed: int
+    bytes: int
+    seconds: float
+    rows_per_second: float
+
+class NDJSONRowParser:
+    """Splits an NDJSON upload into objects as its chunks arrive; blank lines are skipped."""
+    def __init__(self):
+        self.buffer = b""
+        self.index = 0
+
+    def _parse(self, lines: List[bytes]) -> Tuple[List[Tuple[int, Any]], List[BulkItemError]]:
+        rows, errors = [], []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                errors.append(BulkItemError(index=self.index, detail=f"Invalid JSON: {exc}"))
+            else:
+                if isinstance(row, dict):
+                    rows.append((self.index, row))
+                else:
+                    errors.append(BulkItemError(index=self.index, detail="Expected a JSON object"))
+            self.index += 1
+        return rows, errors
+
+    def feed(self, chunk: bytes) -> Tuple[List[Tuple[int, Any]], List[BulkItemError]]:
+        lines = (self.buffer + chunk).split(b"\n")
+        self.buffer = lines.pop()
+        return self._parse(lines)
+
+    def close(self) -> Tuple[List[Tuple[int, Any]], List[BulkItemError]]:
+        lines, self.buffer = [self.buffer], b""
+        return self._parse(lines)
+
+class CSVRowParser:
+    """
+    Splits a CSV upload (header row first) into dicts as its chunks arrive. Only complete
+    records are handed to the csv module: a line break inside a quoted field is detected by
+    an odd number of quotes so far. Empty cells are left out, so schema defaults apply.
+    """
+    def __init__(self):
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")() # Drops a leading BOM (Excel writes one)
+        self.buffer = ""
+        self.header: Optional[List[str]] = None
+        self.index = 0
+
+    def _parse(self, text: str) -> Tuple[List[Tuple[int, Any]], List[BulkItemError]]:
+        rows, errors = [], []
+        for record in csv.reader(io.StringIO(text, newline="")):
+            if not record:
+                continue
+            if self.header is None:
+                self.header = record
+                continue
+            if len(record) != len(self.header):
+                errors.append(BulkItemError(
+                    index=self.index, detail=f"Expected {len(self.header)} columns, got {len(record)}"
+                ))
+            else:
+                rows.append((self.index, {name: value for name, value in zip(self.header, record) if value != ""}))
+            self.index += 1
+        return rows, errors
+
+    def feed(self, chunk: bytes) -> Tuple[List[Tuple[int, Any]], List[BulkItemError]]:
+        text = self.buffer + self.decoder.decode(chunk)
+        # Cut after the last line break that is outside quotes
+        cut = 0
+        quotes = 0
+        position = 0
+        for line in text.splitlines(keepends=True):
+            position += len(line)
+            quotes += line.count('"')
+            if quotes % 2 == 0 and line.endswith(("\n", "\r")):
+                cut = position
+        self.buffer = text[cut:]
+        return self._parse(text[:cut])
+
+    def close(self) -> Tuple[List[Tuple[int, Any]], List[BulkItemError]]:
+        text, self.buffer = self.buffer + self.decoder.decode(b"", final=True), ""
+        return self._parse(text)
+
+IMPORT_PARSERS = {
+    "ndjson": NDJSONRowParser,
+    "csv": CSVRowParser,
+}
+
+# --- Export ---
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+def _export_value(value: Any) -> Any:
+    # Same format as the API's responses, so a row exports the way it reads
+    if isinstance(value, datetime.datetime):
+        return DATETIME_ADAPTER.dump_python(value, mode="json")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+def _export_header(columns: List[str], format: str) -> bytes:
+    return _encode_export_rows([columns], columns, format) if format == "csv" else b""
+
+def _encode_export_rows(rows: List[Any], columns: List[str], format: str) -> bytes:
+    if format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows([[_export_value(value) for value in row] for row in rows])
+        return buffer.getvalue().encode("utf-8")
+    return b"".join(
+        encode_json({name: _export_value(value) for name, value in zip(columns, row)}) + b"\n"
+        for row in rows
+    )
+
+def iter_export(engine: Engine, statement: Any, columns: List[str], format: str, batch_size: int) -> Iterator[bytes]:
+    """
+    Streams the rows of `statement` as NDJSON or CSV, one encoded chunk per batch.
+    
+    Rows come from a server-side cursor (stream_results/yield_per), so memory use depends
+    on batch_size and not on the size of the table.
+    """
+    header = _export_header(columns, format)
+    with engine.connect() as connection:
+        result = connection.execution_options(yield_per=batch_size).execute(statement)
+        for partition in result.partitions():
+            yield header + _encode_export_rows(partition, columns, format)
+            header = b""
+    if header:
+        yield header
+
+async def aiter_export(engine: AsyncEngine, statement: Any, columns: List[str], format: str,
+                       batch_size: int) -> AsyncIterator[bytes]:
+    """iter_export for async mode, streaming from the async engine's server-side cursor."""
+    header = _export_header(columns, format)
+    async with engine.connect() as connection:
+        result = await connection.stream(statement, execution_options={"yield_per": batch_size})
+        async for partition in result.partitions():
+            yield header + _encode_export_rows(partition, columns, format)
+            header = b""
+    if header:
+        yield header
+
+def session_engine(db: Any) -> Union[Engine, AsyncEngine]:
+    """The engine behind a request's Session or AsyncSession, for reads that outlive the session."""
+    if AsyncSession is not None and isinstance(db, AsyncSession):
+        bind = db.bind
+        return bind if isinstance(bind, AsyncEngine) else bind.engine
+    return db.get_bind().engine
+
+# --- Component Responses ---
+def json_bytes_response(body: bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    """Returns already-encoded JSON as-is, skipping FastAPI's own encoding pass."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+def component_json_response(component: BaseComponent, status_code: int = status.HTTP_200_OK) -> Response:
+    return json_bytes_response(component.to_json_bytes(), status_code=status_code)
+
+def component_streaming_response(component: BaseComponent, chunk_size: int = JSON_STREAM_CHUNK_SIZE,
+                                 status_code: int = status.HTTP_200_OK) -> StreamingResponse:
+    """Streams a component tree as compact JSON while it is being encoded."""
+    return StreamingResponse(
+        component.iter_json(chunk_size),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+# --- Conditional Requests (ETag / If-None-Match) ---
+FINGERPRINT_LIBRARIES = ("fastapi", "pydantic", "sqlalchemy", "sqlmodel")
+
+@functools.lru_cache(maxsize=None)
+def code_fingerprint() -> str:
+    """
+    Hash of the library versions and of the source of this module and components.py: what
+    generated payloads depend on besides the config and styles, so it changes on deploy.
+    """
+    environment = hashlib.sha256()
+    for library in FINGERPRINT_LIBRARIES:
+        try:
+            environment.update(f"{library}=={metadata.version(library)};".encode("utf-8"))
+        except metadata.PackageNotFoundError:
+            environment.update(f"{library};".encode("utf-8"))
+    for source in (__file__, inspect.getfile(BaseComponent)):
+        environment.update(Path(source).read_bytes())
+    return environment.hexdigest()
+
+def make_etag(*parts: str) -> str:
+    """Strong ETag derived from the fingerprints a payload depends on."""
+    digest = hashlib.sha256(":".join(parts).encode("utf-8")).hexdigest()[:32]
+    return f'"{digest}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function, so W/ prefixes are ignored
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+def conditional_response(request: Request, etag: str, cache_control: Optional[str],
+                         build_response: Callable[[], Response]) -> Response:
+    """Returns 304 when the client already has `etag`, otherwise the built response with caching headers."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response = build_response()
+    response.headers.update(headers)
+    return response
+
 # --- Dynamic Form Generation (No changes needed here from previous refactor) ---
 class DynamicFormGenerator:
     def __init__(self, config: DynamicCRUDConfig, style_provider: Optional[StyleProvider] = None):
         self.config = config
         self.style_provider = style_provider or StyleProvider()
-        self._component_map = COMPONENT_TYPE_MAP.copy()
+        # Configs do not change after registration, so the (costly) config hash is taken once
+        self._config_fingerprint = config_fingerprint(config)
+        self._component_map = self._build_component_map()
+        # form_id -> {"fingerprint", "page", "dict", "json", "bytes", "html"}, each built on first use
+        self._form_cache: Dict[str, Dict[str, Any]] = {}
+
+    def _build_component_map(self) -> Dict[str, str]:
+        component_map = COMPONENT_TYPE_MAP.copy()
         if self.config.component_map:
-            self._component_map.update(self.config.component_map)
+            component_map.update(self.config.component_map)
+        return component_map
+
+    def get_fingerprint(self) -> str:
+        """Fingerprint of everything a generated form depends on (config + styles)."""
+        return f"{self._config_fingerprint}:{self.style_provider.get_fingerprint()}"
+
+    def get_etag(self, form_id: str = "dynamic-form", representation: str = "json") -> str:
+        # The code fingerprint too: a deploy that changes how forms render must change the ETag
+        return make_etag(code_fingerprint(), self.get_fingerprint(), form_id, representation)
+
+    def _get_cache_entry(self, form_id: str) -> Dict[str, Any]:
+        fingerprint = self.get_fingerprint()
+        entry = self._form_cache.get(form_id)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            # Styles changed since the entry was built (or first use): rebuild
+            self._component_map = self._build_component_map()
+            entry = {"fingerprint": fingerprint}
+            self._form_cache[form_id] = entry
+        return entry
+
+    def get_rendered_form(self, form_id: str = "dynamic-form") -> Dict[str, str]:
+        """The JSON and HTML payloads of the form, for CompiledResourceCache."""
+        return {"json": self.get_form_bytes(form_id).decode("utf-8"), "html": self.get_form_html(form_id)}
+
+    def load_rendered_form(self, rendered: Dict[str, str], form_id: str = "dynamic-form") -> None:
+        """Serves payloads from get_rendered_form without building the component tree."""
+        entry = self._get_cache_entry(form_id)
+        entry["bytes"] = rendered["json"].encode("utf-8")
+        entry["html"] = rendered["html"]
+
+    def peek_form_bytes(self, form_id: str = "dynamic-form") -> Optional[bytes]:
+        """The encoded form if it is already rendered (or loaded), else None."""
+        return self._get_cache_entry(form_id).get("bytes")
+
+    def clear_cache(self) -> None:
+        self._form_cache.clear()
     
     def _get_form_component(self, field_config: FieldConfig) -> BaseComponent:
         component_type = field_config.component_type or self._component_map.get(field_config.type)
@@ -337,6 +1664,43 @@ class DynamicFormGenerator:
             raise ValueError(f"Unsupported form component type: {component_type}")
 
     def generate_form(self, form_id: str = "dynamic-form") -> Page:
+        """
+        Returns the form page for this resource.
+
+        The tree is memoized per form_id and rebuilt only when the config or the
+        styles change, so callers must treat the returned Page as read-only.
+        """
+        entry = self._get_cache_entry(form_id)
+        if "page" not in entry:
+            entry["page"] = self._build_form(form_id)
+        return entry["page"]
+
+    def get_form_dict(self, form_id: str = "dynamic-form") -> Dict[str, Any]:
+        entry = self._get_cache_entry(form_id)
+        if "dict" not in entry:
+            entry["dict"] = self.generate_form(form_id).to_dict()
+        return entry["dict"]
+
+    def get_form_json(self, form_id: str = "dynamic-form") -> str:
+        entry = self._get_cache_entry(form_id)
+        if "json" not in entry:
+            entry["json"] = self.generate_form(form_id).to_json()
+        return entry["json"]
+
+    def get_form_html(self, form_id: str = "dynamic-form") -> str:
+        """Server-rendered HTML of the form (same markup as ComponentRenderer)."""
+        entry = self._get_cache_entry(form_id)
+        if "html" not in entry:
+            entry["html"] = self.generate_form(form_id).render_html()
+        return entry["html"]
+
+    def get_form_bytes(self, form_id: str = "dynamic-form") -> bytes:
+        entry = self._get_cache_entry(form_id)
+        if "bytes" not in entry:
+            entry["bytes"] = self.generate_form(form_id).to_json_bytes()
+        return entry["bytes"]
+
+    def _build_form(self, form_id: str) -> Page:
         form_title = self.config.form_title or f"Create {self.config.resource_name}"
         
         form_component = Form(
@@ -352,10 +1716,11 @@ class DynamicFormGenerator:
             if not field.primary_key and not field.hidden: # Primary key and hidden fields are not in the form
                 field_form_component = self._get_form_component(field)
                 if field_form_component:
-                    form_component.add_child(Div(components=[field_form_component], add_class_name="mb-4"))
+                    form_component.add_child(Div(components=[field_form_component], add_class_name="mb-4",
+                                                 static_fragment=True))
         
         # Add submit and cancel buttons
-        buttons_div = Div(add_class_name="flex justify-end space-x-2")
+        buttons_div = Div(add_class_name="flex justify-end space-x-2", static_fragment=True)
         buttons_div.add_child(Button(
             type="button",
             content=self.config.form_cancel_button_text,
@@ -378,18 +1743,157 @@ class DynamicFormGenerator:
         
         return Page(label=form_title, components=[form_component])
 
+# --- Route Endpoints ---
+def build_endpoint(operation: Callable[..., Any], db_dependency: Any, use_async: bool) -> Callable[..., Any]:
+    """
+    Turns `operation(db, **params)`, written against a sync Session, into a route endpoint.
+
+    In async mode the endpoint is an `async def` that runs the operation on the
+    AsyncSession's connection through `run_sync`, so requests never occupy a
+    threadpool worker; otherwise it is a plain sync endpoint.
+    """
+    signature = inspect.signature(operation)
+    db_parameter = inspect.Parameter("db", inspect.Parameter.KEYWORD_ONLY, default=db_dependency)
+    params = list(signature.parameters.values())[1:]
+
+    if use_async:
+        async def endpoint(db: AsyncSession, **kwargs):
+            return await db.run_sync(operation, **kwargs)
+    else:
+        def endpoint(db: Session, **kwargs):
+            return operation(db, **kwargs)
+
+    endpoint.__signature__ = signature.replace(parameters=[*params, db_parameter])
+    endpoint.__name__ = operation.__name__
+    endpoint.__doc__ = operation.__doc__
+    return endpoint
+
+# --- Compiled Resource Cache ---
+class CompiledResourceCache:
+    """
+    On-disk store of what a worker derives from a resource config and can reuse as-is: the
+    rendered form payloads and the resource's OpenAPI paths and component schemas. Entries are
+    keyed by the config fingerprints and code_fingerprint() (library versions, source of this
+    module and components.py), so changing any of them misses and rebuilds. Files are replaced
+    atomically, so workers starting together can share one directory.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.environment = code_fingerprint()
+
+    def key(self, *fingerprints: str) -> str:
+        return hashlib.sha256(":".join((self.environment, *fingerprints)).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> Dict[str, Any]:
+        try:
+            return json.loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return {} # Missing, or written by an interrupted worker: rebuild
+
+    def update(self, key: str, **parts: Any) -> None:
+        entry = {**self.load(key), **parts}
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(json.dumps(entry).encode("utf-8"))
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
 # --- Dynamic CRUD Manager ---
 class DynamicCRUDManager:
-    def __init__(self, app: FastAPI):
+    def __init__(self, app: FastAPI, async_mode: bool = False, engines: Optional[Dict[str, EngineConfig]] = None,
+                 compiled_cache: Optional[CompiledResourceCache] = None):
         self.app = app
+        self.async_mode = async_mode # Default for configs that leave async_mode unset
         self.resources: Dict[str, Any] = {} # Stores models, schemas, routers, etc.
+        
+        # Engines are created on first use from these configs; "default" is the module engine
+        self.engine_configs: Dict[str, EngineConfig] = {"default": DEFAULT_ENGINE_CONFIG, **(engines or {})}
+        self._engines: Dict[str, Engine] = {}
+        self._async_engines: Dict[str, AsyncEngine] = {}
+        self._session_dependencies: Dict[Any, Callable[..., Any]] = {}
+        self.table_generations = TableGenerations() # Bumped by every write route, keys the list caches
+        
+        # With a compiled cache, the OpenAPI document is assembled from per-resource fragments
+        self.compiled_cache = compiled_cache
+        if compiled_cache is not None:
+            app.openapi = self.openapi
+
+    def add_engine(self, name: str, engine_config: EngineConfig):
+        if name in self._engines or name in self._async_engines:
+            raise ValueError(f"Engine '{name}' is already in use and cannot be replaced")
+        self.engine_configs[name] = engine_config
+
+    def _get_engine_config(self, name: str) -> EngineConfig:
+        engine_config = self.engine_configs.get(name)
+        if engine_config is None:
+            raise ValueError(f"Unknown engine '{name}'. Available engines: {', '.join(self.engine_configs)}")
+        return engine_config
+
+    def get_engine(self, name: str = "default") -> Engine:
+        if name not in self._engines:
+            engine_config = self._get_engine_config(name)
+            if engine_config is DEFAULT_ENGINE_CONFIG:
+                self._engines[name] = engine
+            else:
+                self._engines[name] = create_engine_from_config(engine_config)
+        return self._engines[name]
+
+    def get_async_engine(self, name: str = "default") -> AsyncEngine:
+        if name not in self._async_engines:
+            engine_config = self._get_engine_config(name)
+            if engine_config is DEFAULT_ENGINE_CONFIG:
+                self._async_engines[name] = get_async_engine()
+            else:
+                self._async_engines[name] = create_async_engine_from_config(engine_config)
+        return self._async_engines[name]
+
+    def get_session_dependency(self, name: str = "default", use_async: bool = False) -> Callable[..., Any]:
+        engine_config = self._get_engine_config(name) # Fail at registration time on unknown names
+        if engine_config is DEFAULT_ENGINE_CONFIG:
+            # The module's public dependencies, so app.dependency_overrides[get_db] applies
+            return get_async_db if use_async else get_db
+        key = (name, use_async)
+        if key not in self._session_dependencies:
+            if use_async:
+                async def get_session():
+                    async with AsyncSession(self.get_async_engine(name)) as session:
+                        yield session
+            else:
+                def get_session():
+                    with Session(self.get_engine(name)) as session:
+                        yield session
+            self._session_dependencies[key] = get_session
+        return self._session_dependencies[key]
+
+    async def dispose_engines(self):
+        """Closes the pooled connections of every engine the manager opened (e.g. on shutdown)."""
+        for sync_engine in self._engines.values():
+            sync_engine.dispose()
+        for async_engine in self._async_engines.values():
+            await async_engine.dispose()
 
     def register_resource(self, config: DynamicCRUDConfig):
         # 1. Generate SQLModel
         sql_model = generate_sqlmodel(config)
         # For SQLModel, tables are created via SQLModel.metadata.create_all
         # This should be called once on startup
+        try:
+            self._register_model(config, sql_model)
+        except Exception:
+            # Otherwise the table stays defined in the MetaData and registering the fixed
+            # config later fails with "Table ... is already defined"
+            sql_model.metadata.remove(sql_model.__table__)
+            raise
 
+    def _register_model(self, config: DynamicCRUDConfig, sql_model: Type[SQLModel]):
         # 2. Generate Pydantic Schemas
         schemas = generate_pydantic_schemas(config, sql_model)
         
@@ -403,7 +1907,18 @@ class DynamicCRUDManager:
             **router_kwargs
         )
 
-        db_dependency = Depends(config.db_session_dependency)
+        use_async = self.async_mode if config.async_mode is None else config.async_mode
+        session_dependency = config.async_db_session_dependency if use_async else config.db_session_dependency
+        if session_dependency is None:
+            session_dependency = self.get_session_dependency(config.engine_name, use_async)
+        db_dependency = Depends(session_dependency)
+        if config.read_engine_name:
+            read_db_dependency = Depends(self.get_session_dependency(config.read_engine_name, use_async))
+        else:
+            read_db_dependency = db_dependency
+        
+        if config.pagination not in PAGINATION_MODES:
+            raise ValueError(f"Unknown pagination mode '{config.pagination}'. Expected one of: {', '.join(PAGINATION_MODES)}")
         
         # Primary key field name and type
         pk_field_config = next((f for f in config.fields if f.primary_key), None)
@@ -415,66 +1930,410 @@ class DynamicCRUDManager:
         if pk_py_type is None:
             raise ValueError(f"Primary key field '{pk_field_name}' has an unknown Python type: {pk_field_config.type}")
 
-        # 4. Register API Endpoints
+        if config.validator not in VALIDATORS:
+            raise ValueError(f"Unknown validator '{config.validator}'. Expected one of: {', '.join(VALIDATORS)}")
+        structs = generate_msgspec_structs(config) if config.validator == "msgspec" else None
+        payload_validator = PayloadValidator(schemas, structs)
+        complete_row = table_defaults(sql_model, schemas["Create"], pk_field_name)
+        CreatePayload, create_body, create_route_kwargs = payload_validator.body("Create")
+        UpdatePayload, update_body, update_route_kwargs = payload_validator.body("Update")
+
+        # 4. Generate and register Form endpoint (before "/{item_id}" so "/form" is not taken as an id)
+        form_generator = DynamicFormGenerator(config)
         
-        # Create
-        @router.post("/", response_model=schemas["Base"])
-        def create_item(item: Type[BaseModel], db: Session = db_dependency):
-            # Ensure item is converted to the correct SQLModel type for validation
-            db_item = sql_model.model_validate(item) # Use model_validate for SQLModel
-            db.add(db_item)
-            db.commit()
-            db.refresh(db_item)
+        # Rendered form and OpenAPI fragment from a previous worker, if the cache has them
+        compiled_key = None
+        compiled: Dict[str, Any] = {}
+        if self.compiled_cache is not None:
+            compiled_key = self.compiled_cache.key(form_generator.get_fingerprint(),
+                                                   str(self.app.separate_input_output_schemas))
+            compiled = self.compiled_cache.load(compiled_key)
+            if "form" in compiled:
+                form_generator.load_rendered_form(compiled["form"])
+            else:
+                self.compiled_cache.update(compiled_key, form=form_generator.get_rendered_form())
+        
+        def form_response() -> Response:
+            body = form_generator.peek_form_bytes()
+            if body is not None:
+                return json_bytes_response(body)
+            return component_streaming_response(form_generator.generate_form())
+        
+        @router.get("/form", response_class=StreamingResponse, include_in_schema=False)
+        def get_resource_form(request: Request):
+            return conditional_response(request, form_generator.get_etag(), config.cache_control, form_response)
+
+        # 5. Register API Endpoints
+        # Each operation is written once against a sync Session; build_endpoint
+        # wraps it in a sync or async handler depending on the resource mode.
+        
+        list_query = ListQuery(config, sql_model)
+        statements = ResourceStatements(sql_model, pk_field_name, list_query.field_names)
+        
+        def get_item_or_404(db: Session, item_id: Any):
+            db_item = db.exec(statements.select_by_pk, params={"_pk": item_id}).first()
+            if db_item is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{config.resource_name} not found")
             return db_item
 
+        # Single-statement writes: 404s come from RETURNING no row or a rowcount of 0
+        if config.returning_writes:
+            dialect = self.get_engine(config.engine_name).dialect
+            if not (dialect.insert_returning and dialect.update_returning):
+                raise ValueError(f"returning_writes needs INSERT/UPDATE ... RETURNING, which '{dialect.name}' does not support")
+
+        # Create
+        # Payloads are validated once, by the route; the table model only fills in its defaults
+        if config.returning_writes:
+            def create_item(db: Session, item: CreatePayload = create_body):
+                values = complete_row(payload_validator.values(item))
+                row = db.connection().execute(statements.insert_returning, values).one()
+                db.commit()
+                return row._asdict()
+        else:
+            def create_item(db: Session, item: CreatePayload = create_body):
+                db_item = sql_model(**payload_validator.values(item))
+                db.add(db_item)
+                db.commit()
+                db.refresh(db_item)
+                return db_item
+
         # Read All
-        @router.get("/", response_model=List[schemas["Base"]])
-        def read_all_items(skip: int = 0, limit: int = 100, db: Session = db_dependency):
-            items = db.exec(select(sql_model).offset(skip).limit(limit)).all()
-            return items
+        # Projected rows (fields=...) do not match the response model, so they are encoded directly.
+        # core_reads projects every visible field when no fields are asked for.
+        default_columns = list_query.field_names if config.core_reads else None
+        
+        if config.pagination == "keyset":
+            paginator = KeysetPaginator(config, sql_model, pk_field_config)
+            
+            def read_all_items(db: Session, limit: int = Query(100, ge=1), cursor: Optional[str] = None,
+                               order_by: Optional[str] = None, fields: Optional[str] = None, **filters):
+                columns = list_query.parse_fields(fields) or default_columns
+                page = paginator.fetch_page(db, limit, cursor, order_by, list_query.conditions(filters), columns)
+                if columns:
+                    page["items"] = list_query.project(page["items"], columns)
+                    return json_bytes_response(encode_json(page))
+                return page
+            read_all_response_model = schemas["Page"]
+        else:
+            def read_all_items(db: Session, skip: int = 0, limit: int = 100, sort: Optional[str] = None,
+                               fields: Optional[str] = None, **filters):
+                columns = list_query.parse_fields(fields) or default_columns
+                statement = list_query.select(columns)
+                conditions = list_query.conditions(filters)
+                if conditions:
+                    statement = statement.where(*conditions)
+                statement = statement.order_by(*list_query.order_by(sort)).offset(skip).limit(limit)
+                items = db.exec(statement).all()
+                if columns:
+                    return json_bytes_response(encode_json(list_query.project(items, columns)))
+                return items
+            read_all_response_model = List[schemas["Base"]]
+        list_query.with_filter_parameters(read_all_items)
 
         # Read One
-        @router.get(f"/{{'{pk_field_name}':{pk_py_type.__name__}}}", response_model=schemas["Base"])
-        def read_item(item_id: pk_py_type, db: Session = db_dependency):
-            db_item = db.exec(select(sql_model).where(getattr(sql_model, pk_field_name) == item_id)).first()
-            if db_item is None:
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{config.resource_name} not found")
-            return db_item
+        if config.core_reads:
+            def read_item(db: Session, item_id: pk_py_type):
+                row = db.exec(statements.select_row_by_pk, params={"_pk": item_id}).first()
+                if row is None:
+                    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{config.resource_name} not found")
+                return json_bytes_response(encode_json(list_query.project([row], list_query.field_names)[0]))
+        else:
+            def read_item(db: Session, item_id: pk_py_type):
+                return get_item_or_404(db, item_id)
 
         # Update
-        @router.put(f"/{{'{pk_field_name}':{pk_py_type.__name__}}}", response_model=schemas["Base"])
-        def update_item(item_id: pk_py_type, item: Type[BaseModel], db: Session = db_dependency):
-            db_item = db.exec(select(sql_model).where(getattr(sql_model, pk_field_name) == item_id)).first()
-            if db_item is None:
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{config.resource_name} not found")
-            
-            for key, value in item.dict(exclude_unset=True).items():
-                setattr(db_item, key, value)
-            
-            db.add(db_item)
-            db.commit()
-            db.refresh(db_item)
-            return db_item
+        if config.returning_writes:
+            def update_item(db: Session, item_id: pk_py_type, item: UpdatePayload = update_body):
+                values = payload_validator.values(item, partial=True)
+                if not values:
+                    return get_item_or_404(db, item_id)
+                row = db.connection().execute(statements.update_returning, {**values, "_pk": item_id}).first()
+                if row is None:
+                    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{config.resource_name} not found")
+                db.commit()
+                return row._asdict()
+        else:
+            def update_item(db: Session, item_id: pk_py_type, item: UpdatePayload = update_body):
+                db_item = get_item_or_404(db, item_id)
+                
+                for key, value in payload_validator.values(item, partial=True).items():
+                    setattr(db_item, key, value)
+                
+                db.add(db_item)
+                db.commit()
+                db.refresh(db_item)
+                return db_item
 
         # Delete
-        @router.delete(f"/{{'{pk_field_name}':{pk_py_type.__name__}}}", status_code=status.HTTP_204_NO_CONTENT)
-        def delete_item(item_id: pk_py_type, db: Session = db_dependency):
-            db_item = db.exec(select(sql_model).where(getattr(sql_model, pk_field_name) == item_id)).first()
-            if db_item is None:
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{config.resource_name} not found")
+        if config.returning_writes:
+            def delete_item(db: Session, item_id: pk_py_type):
+                result = db.connection().execute(statements.delete_by_pk, {"_pk": item_id})
+                if result.rowcount == 0:
+                    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{config.resource_name} not found")
+                db.commit()
+                return None # 204 No Content
+        else:
+            def delete_item(db: Session, item_id: pk_py_type):
+                db_item = get_item_or_404(db, item_id)
+                
+                db.delete(db_item)
+                db.commit()
+                return None # 204 No Content
+
+        # Write listeners let the caches drop what a write may have changed. They run after the
+        # operation, also when it fails part-way (the bulk and import routes commit per chunk).
+        write_listeners: List[Callable[[List[Any]], None]] = []
+        
+        def notify_write(item_ids: List[Any]):
+            for listener in write_listeners:
+                listener(item_ids)
+        
+        def notifying(operation: Callable[..., Any], item_ids: Callable[[Dict[str, Any]], List[Any]]):
+            @functools.wraps(operation)
+            def notifying_operation(db: Session, **kwargs):
+                try:
+                    return operation(db, **kwargs)
+                finally:
+                    notify_write(item_ids(kwargs))
+            return notifying_operation
+        
+        # Row cache: Read One serves cached response bodies, writes drop the rows they touch
+        row_cache: Optional[RowCacheBackend] = None
+        if config.row_cache:
+            row_cache = config.row_cache_backend or LRURowCache(config.row_cache_max_entries)
+            cache_prefix = f"{sql_model.__tablename__}:"
+            row_generations = TableGenerations() # Bumped before a write drops its rows
+            BaseSchema = schemas["Base"]
+            uncached_read_item = read_item
             
-            db.delete(db_item)
-            db.commit()
-            return None # 204 No Content
+            @functools.wraps(uncached_read_item)
+            def read_item(db: Session, item_id: pk_py_type):
+                key = f"{cache_prefix}{item_id}"
+                body = row_cache.get(key)
+                if body is None:
+                    # Like the list cache, the generation is read before querying: a row read before
+                    # a write committed is not stored, or is dropped again if the write's
+                    # invalidation ran between the check and the store
+                    generation = row_generations.get(cache_prefix)
+                    result = uncached_read_item(db, item_id)
+                    if isinstance(result, Response):
+                        body = result.body
+                    else:
+                        body = encode_json(BaseSchema.model_validate(result, from_attributes=True).model_dump(mode="json"))
+                    if row_generations.get(cache_prefix) == generation:
+                        row_cache.set(key, body, config.row_cache_ttl)
+                        if row_generations.get(cache_prefix) != generation:
+                            row_cache.delete(key)
+                return json_bytes_response(body)
+            
+            def invalidate_rows(item_ids: List[Any]) -> None:
+                row_generations.bump(cache_prefix)
+                row_cache.delete(*(f"{cache_prefix}{item_id}" for item_id in item_ids))
+            
+            write_listeners.append(invalidate_rows)
+        
+        # List cache: Read All response bodies keyed on the table's write generation and the
+        # normalized query, so every write makes all cached pages of the table unreachable
+        list_cache: Optional[RowCacheBackend] = None
+        if config.list_cache:
+            list_cache = config.list_cache_backend or LRURowCache(config.list_cache_max_entries)
+            table_name = sql_model.__tablename__
+            list_adapter = TypeAdapter(read_all_response_model)
+            uncached_read_all_items = read_all_items
+            
+            @functools.wraps(uncached_read_all_items)
+            def read_all_items(db: Session, **kwargs):
+                # The generation is read before querying: a write landing meanwhile bumps it, so a
+                # result that may predate the write is stored under a key nobody asks for again
+                query = json.dumps(kwargs, sort_keys=True, default=str, separators=(",", ":"))
+                key = f"{table_name}:{self.table_generations.get(table_name)}:{query}"
+                body = list_cache.get(key)
+                if body is None:
+                    result = uncached_read_all_items(db, **kwargs)
+                    if isinstance(result, Response):
+                        body = result.body
+                    else:
+                        body = list_adapter.dump_json(list_adapter.validate_python(result, from_attributes=True))
+                    list_cache.set(key, body, config.list_cache_ttl)
+                return json_bytes_response(body)
+            
+            write_listeners.append(lambda item_ids: self.table_generations.bump(table_name))
+        
+        if row_cache is not None or list_cache is not None:
+            @router.get("/cache/stats", include_in_schema=False)
+            def get_cache_stats():
+                return {
+                    "row_cache": row_cache.stats() if row_cache is not None else None,
+                    "list_cache": list_cache.stats() if list_cache is not None else None,
+                }
 
-        self.app.include_router(router)
+        # Bulk (registered before "/{item_id}" so "/bulk" is not taken as an id)
+        bulk_writer = BulkWriter(sql_model, schemas, pk_field_name, pk_py_type, config.bulk_chunk_size, statements,
+                                 payload_validator)
         
-        # 5. Generate and register Form endpoint
-        form_generator = DynamicFormGenerator(config)
+        def bulk_create_items(db: Session, items: List[Dict[str, Any]] = Body(...)):
+            return bulk_writer.create(db, items)
+        
+        def bulk_update_items(db: Session, items: List[Dict[str, Any]] = Body(...)):
+            return bulk_writer.update(db, items)
+        
+        def bulk_delete_items(db: Session, ids: List[pk_py_type] = Body(...)):
+            return bulk_writer.delete(db, ids)
+        
+        if write_listeners:
+            def bulk_item_ids(kwargs: Dict[str, Any]) -> List[Any]:
+                # Coerced like BulkWriter.update does, so "1" and 1 drop the same cache key
+                item_ids = []
+                for item in kwargs["items"]:
+                    if isinstance(item, dict) and item.get(pk_field_name) is not None:
+                        try:
+                            item_ids.append(bulk_writer.pk_adapter.validate_python(item[pk_field_name]))
+                        except ValidationError:
+                            pass # Rejected by the writer as well, so nothing was written for it
+                return item_ids
+            
+            create_item = notifying(create_item, lambda kwargs: [])
+            update_item = notifying(update_item, lambda kwargs: [kwargs["item_id"]])
+            delete_item = notifying(delete_item, lambda kwargs: [kwargs["item_id"]])
+            bulk_create_items = notifying(bulk_create_items, lambda kwargs: [])
+            bulk_update_items = notifying(bulk_update_items, bulk_item_ids)
+            bulk_delete_items = notifying(bulk_delete_items, lambda kwargs: kwargs["ids"])
+        
+        router.post("/bulk", response_model=BulkResult)(build_endpoint(bulk_create_items, db_dependency, use_async))
+        router.patch("/bulk", response_model=BulkResult)(build_endpoint(bulk_update_items, db_dependency, use_async))
+        router.delete("/bulk", response_model=BulkResult)(build_endpoint(bulk_delete_items, db_dependency, use_async))
+        
+        # Import (async so the upload is read as it arrives; batches are written off the event loop)
+        async def write_import_batch(db: Any, batch: List[Tuple[int, Any]], errors: List[BulkItemError]) -> int:
+            if use_async:
+                return await db.run_sync(bulk_writer.create_indexed, batch, errors)
+            return await run_in_threadpool(bulk_writer.create_indexed, db, batch, errors)
+        
+        async def import_items(request: Request, format: Optional[str] = Query(None, pattern="^(ndjson|csv)$"),
+                               db: Any = db_dependency):
+            if format is None:
+                format = "csv" if request.headers.get("content-type", "").startswith("text/csv") else "ndjson"
+            parser = IMPORT_PARSERS[format]()
+            started = time.perf_counter()
+            received = 0
+            written = 0
+            rows_read = 0
+            errors: List[BulkItemError] = []
+            batch: List[Tuple[int, Any]] = []
+            batch_errors: List[BulkItemError] = [] # Parse errors of the rows in the current batch
+            
+            async def flush() -> int:
+                count = 0
+                if batch:
+                    try:
+                        count = await write_import_batch(db, batch, batch_errors)
+                    finally:
+                        notify_write([])
+                errors.extend(sorted(batch_errors, key=lambda error: error.index))
+                del errors[IMPORT_MAX_REPORTED_ERRORS:]
+                batch.clear()
+                batch_errors.clear()
+                return count
+            
+            async for chunk in request.stream():
+                received += len(chunk)
+                rows, parse_errors = parser.feed(chunk)
+                rows_read += len(rows) + len(parse_errors)
+                batch.extend(rows)
+                batch_errors.extend(parse_errors)
+                if len(batch) >= config.bulk_chunk_size:
+                    written += await flush()
+            rows, parse_errors = parser.close()
+            rows_read += len(rows) + len(parse_errors)
+            batch.extend(rows)
+            batch_errors.extend(parse_errors)
+            written += await flush()
+            
+            seconds = time.perf_counter() - started
+            return ImportResult(
+                processed=written, errors=errors, rows=rows_read, failed=rows_read - written,
+                bytes=received, seconds=round(seconds, 3),
+                rows_per_second=round(rows_read / seconds, 1) if seconds else 0.0,
+            )
         
-        @router.get("/form", response_model=Dict[str, Any], include_in_schema=False)
-        def get_resource_form():
-            return form_generator.generate_form().to_dict()
+        router.post("/import", response_model=ImportResult)(import_items)
+        
+        # Export: the session dependency picks the database, but the rows are read on a connection
+        # of their own from its engine, since the stream outlives the request's session
+        def export_response(db: Any, export_format: str, fields: Optional[str], filters: Dict[str, Any]):
+            columns = list_query.parse_fields(fields) or list_query.field_names
+            statement = list_query.select(columns)
+            conditions = list_query.conditions(filters)
+            if conditions:
+                statement = statement.where(*conditions)
+            statement = statement.order_by(getattr(sql_model, pk_field_name))
+            stream = aiter_export if use_async else iter_export
+            return StreamingResponse(
+                stream(session_engine(db), statement, columns, export_format, config.export_batch_size),
+                media_type=EXPORT_MEDIA_TYPES[export_format],
+                headers={"Content-Disposition": f'attachment; filename="{sql_model.__tablename__}.{export_format}"'},
+            )
+        
+        if use_async:
+            async def export_items(export_format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+                                   fields: Optional[str] = None, db: Any = read_db_dependency, **filters):
+                return export_response(db, export_format, fields, filters)
+        else:
+            def export_items(export_format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+                             fields: Optional[str] = None, db: Any = read_db_dependency, **filters):
+                return export_response(db, export_format, fields, filters)
+        
+        router.get("/export", response_class=StreamingResponse)(list_query.with_filter_parameters(export_items))
+        
+        # Count / Aggregate (one SELECT COUNT(*) / SELECT ... GROUP BY, with the list route's filters)
+        aggregator = Aggregator(config, sql_model)
+        approximate_count = ApproximateCount(sql_model, config.approximate_count_ttl)
+        
+        def count_items(db: Session, approximate: bool = False, **filters):
+            conditions = list_query.conditions(filters)
+            if approximate and not conditions:
+                return CountResult(count=approximate_count.get(db), approximate=True)
+            statement = sa_select(func.count()).select_from(sql_model)
+            if conditions:
+                statement = statement.where(*conditions)
+            return CountResult(count=db.exec(statement).scalar_one())
+        
+        def aggregate_items(db: Session, metric: List[str] = Query(["count"]), group_by: Optional[str] = None,
+                            limit: int = Query(config.aggregate_max_groups, ge=1, le=config.aggregate_max_groups),
+                            **filters):
+            metrics = aggregator.parse_metrics(metric)
+            group_fields = aggregator.parse_group_by(group_by)
+            statement = aggregator.select(metrics, group_fields, list_query.conditions(filters))
+            rows = db.exec(statement.limit(limit)).all()
+            labels = [label for label, _, _ in metrics]
+            return json_bytes_response(encode_json(aggregator.project(rows, group_fields, labels)))
+        
+        router.get("/count", response_model=CountResult)(
+            build_endpoint(list_query.with_filter_parameters(count_items), read_db_dependency, use_async)
+        )
+        router.get("/aggregate", response_model=List[Dict[str, Any]])(
+            build_endpoint(list_query.with_filter_parameters(aggregate_items), read_db_dependency, use_async)
+        )
+        
+        router.post("/", response_model=schemas["Base"], **create_route_kwargs)(build_endpoint(create_item, db_dependency, use_async))
+        router.get("/", response_model=read_all_response_model)(build_endpoint(read_all_items, read_db_dependency, use_async))
+        router.get("/{item_id}", response_model=schemas["Base"])(build_endpoint(read_item, read_db_dependency, use_async))
+        router.put("/{item_id}", response_model=schemas["Base"], **update_route_kwargs)(build_endpoint(update_item, db_dependency, use_async))
+        router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)(
+            build_endpoint(delete_item, db_dependency, use_async)
+        )
+
+        # Routes are copied when the router is included, so this must come last. The router is
+        # included into a copy of the app's router (same settings, empty route list) and the
+        # routes are published with one assignment: code iterating the app's routes (e.g. OpenAPI
+        # generation while the config loader replaces a resource) never sees the list change
+        staging_router = copy.copy(self.app.router)
+        staging_router.routes = []
+        staging_router.include_router(router)
+        app_routes = staging_router.routes
+        self.app.router.routes = [*self.app.router.routes, *app_routes]
+        self.app.openapi_schema = None # Regenerated with this resource on next use
 
         self.resources[config.resource_name] = {
             "model": sql_model,
@@ -482,9 +2341,286 @@ class DynamicCRUDManager:
             "router": router,
             "config": config,
             "form_generator": form_generator,
+            "async_mode": use_async,
+            "row_cache": row_cache,
+            "list_cache": list_cache,
+            "statements": statements,
+            "app_routes": app_routes,
+            "compiled_key": compiled_key,
+            "openapi": compiled.get("openapi"), # {"paths", "schemas"}, filled by openapi() if not cached
+        }
+        
+    def _swap_routes(self, old_routes: List[Any], new_routes: List[Any]) -> None:
+        # The app sees either the old or the new route list (one assignment), and requests
+        # already running keep the handlers they matched
+        old_ids = {id(route) for route in old_routes}
+        new_ids = {id(route) for route in new_routes}
+        routes = []
+        for route in self.app.router.routes:
+            if id(route) in new_ids:
+                continue
+            if id(route) in old_ids:
+                if new_routes:
+                    routes.extend(new_routes) # Where the old routes were, so matching order is kept
+                    new_routes = []
+                continue
+            routes.append(route)
+        routes.extend(new_routes)
+        self.app.router.routes = routes
+        self.app.openapi_schema = None
+
+    def _drop_resource_caches(self, resource: Dict[str, Any]) -> None:
+        for cache in (resource["row_cache"], resource["list_cache"]):
+            if cache is not None:
+                cache.clear()
+
+    def replace_resource(self, config: DynamicCRUDConfig):
+        """
+        Registers `config` in place of the resource of the same name and swaps its routes in one
+        step. The table schema in the database is not migrated.
+        """
+        old = self.resources.get(config.resource_name)
+        if old is None:
+            return self.register_resource(config)
+
+        # The new model defines the table again in the same MetaData
+        old_table = old["model"].__table__
+        metadata = old_table.metadata
+        metadata.remove(old_table)
+        try:
+            self.register_resource(config)
+        except Exception:
+            metadata._add_table(old_table.name, old_table.schema, old_table)
+            self.resources[config.resource_name] = old
+            raise
+        self._swap_routes(old["app_routes"], self.resources[config.resource_name]["app_routes"])
+        self._drop_resource_caches(old)
+
+    def unregister_resource(self, resource_name: str) -> None:
+        """Removes a resource's routes and its table from the MetaData (the database table is kept)."""
+        resource = self.get_resource(resource_name)
+        self._swap_routes(resource["app_routes"], [])
+        table = resource["model"].__table__
+        table.metadata.remove(table)
+        del self.resources[resource_name]
+        self._drop_resource_caches(resource)
+
+    def openapi(self) -> Dict[str, Any]:
+        """
+        Builds the app's OpenAPI document like FastAPI does, except that the paths and schemas
+        of each resource come from its cached fragment. Fragments missing from the cache are
+        generated from the resource's routes alone and stored for the next worker.
+        """
+        if self.app.openapi_schema:
+            return self.app.openapi_schema
+        
+        resource_of_route = {id(route): resource for resource in self.resources.values() for route in resource["app_routes"]}
+        other_routes = [route for route in self.app.router.routes if id(route) not in resource_of_route]
+        document_kwargs = {
+            "title": self.app.title,
+            "version": self.app.version,
+            "openapi_version": self.app.openapi_version,
+            "summary": self.app.summary,
+            "description": self.app.description,
+            "terms_of_service": self.app.terms_of_service,
+            "contact": self.app.contact,
+            "license_info": self.app.license_info,
+            "tags": self.app.openapi_tags,
+            "servers": self.app.servers,
+            "separate_input_output_schemas": self.app.separate_input_output_schemas,
         }
+        document = get_openapi(routes=other_routes, webhooks=self.app.webhooks.routes, **document_kwargs)
+        other_paths = document.get("paths", {})
+        schemas = document.get("components", {}).get("schemas", {})
+        
+        # Paths in route order, as FastAPI would list them
+        paths: Dict[str, Any] = {}
+        for route in self.app.router.routes:
+            resource = resource_of_route.get(id(route))
+            if resource is None:
+                path = getattr(route, "path_format", None)
+                if path in other_paths:
+                    paths[path] = other_paths[path]
+                continue
+            if resource["openapi"] is None:
+                fragment = get_openapi(routes=resource["app_routes"], **document_kwargs)
+                resource["openapi"] = {
+                    "paths": fragment.get("paths", {}),
+                    "schemas": fragment.get("components", {}).get("schemas", {}),
+                }
+                self.compiled_cache.update(resource["compiled_key"], openapi=resource["openapi"])
+            paths.update(resource["openapi"]["paths"])
+            schemas.update(resource["openapi"]["schemas"])
+        paths.update(other_paths)
         
+        if paths:
+            document["paths"] = paths
+        if schemas:
+            document.setdefault("components", {})["schemas"] = dict(sorted(schemas.items()))
+        self.app.openapi_schema = document
+        return document
+
     def get_resource(self, resource_name: str):
         if resource_name not in self.resources:
             raise ValueError(f"Resource '{resource_name}' not registered.")
         return self.resources[resource_name]
+
+    def find_missing_indexes(self) -> Dict[str, List[str]]:
+        """
+        Names of the indexes each resource's model declares (FieldConfig.index and
+        DynamicCRUDConfig.indexes) that its live table lacks. create_all only builds the indexes
+        of tables it creates, so indexes added to an existing resource are reported here.
+        Resources whose table does not exist yet are skipped.
+        """
+        missing = {}
+        inspectors = {}
+        for resource_name, resource in self.resources.items():
+            engine_name = resource["config"].engine_name
+            if engine_name not in inspectors:
+                inspectors[engine_name] = sa_inspect(self.get_engine(engine_name))
+            inspector = inspectors[engine_name]
+            table = resource["model"].__table__
+            if not inspector.has_table(table.name, schema=table.schema):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name, schema=table.schema)}
+            names = sorted(index.name for index in table.indexes if index.name not in existing)
+            if names:
+                missing[resource_name] = names
+        return missing
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Row and list cache counters of every resource that has a cache enabled."""
+        stats = {}
+        for resource_name, resource in self.resources.items():
+            caches = {name: resource[name] for name in ("row_cache", "list_cache") if resource[name] is not None}
+            if caches:
+                stats[resource_name] = {name: cache.stats() for name, cache in caches.items()}
+        return stats
+
+    def find_resource(self, name: str) -> Optional[Dict[str, Any]]:
+        """Looks a resource up by resource name or table name, case-insensitively."""
+        name = name.lower()
+        for resource_name, resource in self.resources.items():
+            config = resource["config"]
+            table_name = config.table_name or f"{config.resource_name.lower()}s"
+            if name in (resource_name.lower(), table_name.lower()):
+                return resource
+        return None
+
+# --- Resource Config Files ---
+class ResourceConfigLoader:
+    """
+    Registers the DynamicCRUDConfigs defined in a directory of .json, .yaml and .yml files (one
+    config or a list of configs per file) and keeps the app in sync with them: reload() registers
+    new resources, replaces those whose config fingerprint changed and unregisters those whose
+    definition is gone. watch() polls the directory from a background thread and reloads on change.
+    
+    Configs are read and validated before anything is touched, so a broken file leaves the
+    running resources as they are. Tables of added resources are created if missing; existing
+    tables are not migrated.
+    """
+    SUFFIXES = (".json", ".yaml", ".yml")
+
+    def __init__(self, manager: DynamicCRUDManager, directory: Union[str, Path], create_tables: bool = True,
+                 poll_interval: float = 1.0):
+        self.manager = manager
+        self.directory = Path(directory)
+        self.create_tables = create_tables
+        self.poll_interval = poll_interval
+        self.fingerprints: Dict[str, str] = {} # resource_name -> config_fingerprint of the loaded config
+        self.last_error: Optional[Exception] = None
+        self._loaded_snapshot: Dict[Path, Tuple[int, int]] = {} # File versions the last reload() read
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _paths(self) -> List[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(path for path in self.directory.iterdir() if path.suffix in self.SUFFIXES and path.is_file())
+
+    def _read_file(self, path: Path) -> List[DynamicCRUDConfig]:
+        text = path.read_text(encoding="utf-8")
+        if path.suffix == ".json":
+            data = json.loads(text)
+        elif yaml is None:
+            raise RuntimeError(f"PyYAML is required to load '{path}' (fastsoft[yaml])")
+        else:
+            data = yaml.safe_load(text)
+        if data is None:
+            return []
+        return [DynamicCRUDConfig.model_validate(item) for item in (data if isinstance(data, list) else [data])]
+
+    def read_configs(self) -> Dict[str, DynamicCRUDConfig]:
+        configs: Dict[str, DynamicCRUDConfig] = {}
+        for path in self._paths():
+            for config in self._read_file(path):
+                if config.resource_name in configs:
+                    raise ValueError(f"Resource '{config.resource_name}' is defined more than once in {self.directory}")
+                configs[config.resource_name] = config
+        return configs
+
+    def reload(self) -> Dict[str, List[str]]:
+        """Applies the directory's configs and returns the names of the resources added, replaced and removed."""
+        with self._lock:
+            self._loaded_snapshot = self._snapshot()
+            configs = self.read_configs()
+            changes: Dict[str, List[str]] = {"added": [], "replaced": [], "removed": []}
+            
+            for resource_name in [name for name in self.fingerprints if name not in configs]:
+                self.manager.unregister_resource(resource_name)
+                del self.fingerprints[resource_name]
+                changes["removed"].append(resource_name)
+            
+            for resource_name, config in configs.items():
+                fingerprint = config_fingerprint(config)
+                if self.fingerprints.get(resource_name) == fingerprint:
+                    continue
+                if resource_name in self.fingerprints:
+                    self.manager.replace_resource(config)
+                    changes["replaced"].append(resource_name)
+                else:
+                    self.manager.register_resource(config)
+                    changes["added"].append(resource_name)
+                    if self.create_tables:
+                        table = self.manager.get_resource(resource_name)["model"].__table__
+                        table.create(self.manager.get_engine(config.engine_name), checkfirst=True)
+                self.fingerprints[resource_name] = fingerprint
+            return changes
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for path in self._paths():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue # Removed while listing
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def watch(self) -> None:
+        """Polls the directory every poll_interval seconds and reloads when a file changed since the last reload()."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        
+        def poll():
+            while not self._stop.wait(self.poll_interval):
+                if self._snapshot() == self._loaded_snapshot:
+                    continue
+                try:
+                    self.reload()
+                    self.last_error = None
+                except Exception as exc: # Keep serving the previous configs until the files are fixed
+                    self.last_error = exc
+                    logging.getLogger(__name__).exception("Reloading resource configs from %s failed", self.directory)
+        
+        self._thread = threading.Thread(target=poll, name="resource-config-loader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
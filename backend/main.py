@@ -1,13 +1,21 @@
+import hashlib
+import logging
+from pathlib import Path
 from typing import Union
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
 
-from components import get_example, get_simple_example
-from dynamic_crud import DynamicCRUDManager, FieldConfig, DynamicCRUDConfig, engine
+import components
+from components import StyleProvider, get_example_page, get_simple_example_page
+from dynamic_crud import (
+    DynamicCRUDManager, FieldConfig, DynamicCRUDConfig, ResourceConfigLoader,
+    component_json_response, component_streaming_response, json_bytes_response,
+    conditional_response, make_etag
+)
 from sqlmodel import SQLModel
 from contextlib import asynccontextmanager # Import asynccontextmanager
 
@@ -15,13 +23,29 @@ from contextlib import asynccontextmanager # Import asynccontextmanager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic: Create tables
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(crud_manager.get_engine())
+    # create_all does not add indexes to tables that already exist
+    for resource_name, index_names in crud_manager.find_missing_indexes().items():
+        logging.getLogger(__name__).warning(
+            "Resource %s: indexes missing from the database: %s", resource_name, ", ".join(index_names)
+        )
+    config_loader.watch()
     yield
-    # Shutdown logic (if any)
+    # Shutdown logic: stop watching config files, close pooled connections
+    config_loader.stop()
+    await crud_manager.dispose_engines()
 
 
 templates = Jinja2Templates(directory="backend/templates")
 
+# The example pages only change when components.py does, and the rendered form pages
+# also depend on the templates: hash both once so ETags change on deploy.
+EXAMPLES_FINGERPRINT = hashlib.sha256(Path(components.__file__).read_bytes()).hexdigest()
+TEMPLATES_FINGERPRINT = hashlib.sha256(
+    b"".join(path.read_bytes() for path in sorted(Path("backend/templates").glob("*.html")))
+).hexdigest()
+EXAMPLES_CACHE_CONTROL = "no-cache"
+
 app = FastAPI(lifespan=lifespan) # Pass the lifespan function to FastAPI
 app.mount("/static", StaticFiles(directory="backend/static"), name="static")
 
@@ -62,6 +86,10 @@ user_config = DynamicCRUDConfig(
 # Register the User resource
 crud_manager.register_resource(user_config)
 
+# Resources defined in backend/resources/*.json|yaml, re-registered when their file changes
+config_loader = ResourceConfigLoader(crud_manager, "backend/resources")
+config_loader.reload()
+
 
 
 @app.get("/")
@@ -71,25 +99,53 @@ async def read_root(request: Request):
     )
 
 @app.get("/api/components")
-def read_item():
-    return get_example()
+def read_item(request: Request):
+    etag = make_etag(EXAMPLES_FINGERPRINT, StyleProvider.get_fingerprint(), "example")
+    return conditional_response(
+        request, etag, EXAMPLES_CACHE_CONTROL,
+        lambda: component_streaming_response(get_example_page()),
+    )
 
 @app.get("/api/components/simple")
-def read_simple_item():
-    return get_simple_example()
+def read_simple_item(request: Request):
+    etag = make_etag(EXAMPLES_FINGERPRINT, StyleProvider.get_fingerprint(), "simple")
+    return conditional_response(
+        request, etag, EXAMPLES_CACHE_CONTROL,
+        lambda: component_json_response(get_simple_example_page()),
+    )
 
 @app.get("/api/components/user")
-def read_simple_item():
+def read_user_form_item(request: Request):
     user_resource = crud_manager.get_resource("User")
-    form_json = user_resource["form_generator"].generate_form().to_json()
-    return form_json
+    form_generator = user_resource["form_generator"]
+    return conditional_response(
+        request, form_generator.get_etag(), user_resource["config"].cache_control,
+        lambda: json_bytes_response(form_generator.get_form_bytes()),
+    )
 
 
 # Dynamic form endpoint for User resource
 @app.get("/forms/users", response_class=HTMLResponse, include_in_schema=False)
 async def get_user_form(request: Request):
     user_resource = crud_manager.get_resource("User")
-    form_json = user_resource["form_generator"].generate_form().to_json()
-    return templates.TemplateResponse(
-        request=request, name="dynamic_form.html", context={"form_data": form_json}
+    return render_resource_form(request, user_resource)
+
+
+# Server-rendered form for any registered resource (by resource or table name)
+@app.get("/forms/{resource}", response_class=HTMLResponse, include_in_schema=False)
+async def get_resource_form_page(request: Request, resource: str):
+    resource_entry = crud_manager.find_resource(resource)
+    if resource_entry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Resource '{resource}' not found")
+    return render_resource_form(request, resource_entry)
+
+
+def render_resource_form(request: Request, resource_entry: dict):
+    form_generator = resource_entry["form_generator"]
+    etag = make_etag(form_generator.get_etag(representation="html"), TEMPLATES_FINGERPRINT)
+    return conditional_response(
+        request, etag, resource_entry["config"].cache_control,
+        lambda: templates.TemplateResponse(
+            request=request, name="dynamic_form.html", context={"form_html": form_generator.get_form_html()}
+        ),
     )
\ No newline at end of file